@@ -5,12 +5,18 @@
 #
 # This implementation:
 
-# - Computes missing hashes in a ThreadPoolExecutor (safe on macOS)
-# - Uses integer popcount((a ^ b)) for Hamming distance checks with a compatibility fallback
-
-from core.hash_utils import _compute_hashes_parallel, _normalize_path
-from typing import List, Tuple, Dict, Any, Optional
+# - Computes missing hashes in a ThreadPoolExecutor (safe on macOS), straight into packed rows
+#   (JPEGs decoded in draft mode, see core/fast_hash.py)
+# - Packs hashes into uint64 words and uses popcount((a ^ b)) for Hamming distance checks
+# - Compiles the all-pairs Hamming loop with Numba (POPCNT) when numba is installed,
+#   otherwise computes it block-wise with a vectorized NumPy XOR + popcount
+# - On large inputs, only compares pairs that agree exactly on one hash chunk (multi-index blocking)
+
+from core.hash_utils import _compute_packed_hashes, _normalize_path
+from core.image_scanner import UNSCANNED_FIELDS
+from typing import Callable, List, Tuple, Dict, Any, Optional
 import logging
+import operator
 import os
 import math
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -18,6 +24,12 @@ from datetime import datetime
 from collections import defaultdict
 from PIL import Image, ImageOps, UnidentifiedImageError
 import imagehash
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy kernel is used instead
+    njit = None
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +37,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_HASH_SIZE = 16
 # Default thread pool size
 DEFAULT_MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+# Upper bound on distance-matrix cells computed per block (uint16 -> ~32 MB)
+HAMMING_BLOCK_CELLS = 1 << 24
+# Chunk blocking is only tried from this many (ref, work) pairs on, with chunks of at
+# least BLOCKING_MIN_CHUNK_BITS bits, and used for a block only when it cuts the pairs
+# to compare by at least BLOCKING_MIN_GAIN times
+BLOCKING_MIN_PAIRS = 1 << 22
+BLOCKING_MIN_CHUNK_BITS = 8
+BLOCKING_MIN_GAIN = 4
 
 
 # --- helpers ----------------------------------------------------------------
@@ -83,6 +103,274 @@ def _hamming_distance_int(a: int, b: int) -> int:
     return _popcount(x)
 
 
+def _stack_rows(rows: List[np.ndarray], hash_bits: int) -> np.ndarray:
+    """Stack packed hash rows into a contiguous (N, words) uint64 matrix (empty-safe)."""
+    if not rows:
+        return np.empty((0, max(1, (hash_bits + 63) // 64)), dtype=np.uint64)
+    return np.ascontiguousarray(np.stack(rows), dtype=np.uint64)
+
+
+# Bits set in each byte value; used when numpy has no native bitwise_count (numpy < 2.0)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount_words(x: np.ndarray) -> np.ndarray:
+    """Bits set in each uint64 of x, as uint16."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x).astype(np.uint16)
+    return _POPCOUNT_TABLE[x.view(np.uint8).reshape(x.shape + (8,))].sum(axis=-1, dtype=np.uint16)
+
+
+def _hamming_block_numpy(a: np.ndarray, b: np.ndarray, max_dist: int) -> np.ndarray:
+    """
+    Distance matrix between every row of a (n, words) and b (m, words), vectorized in NumPy.
+    Works one 64-bit word at a time and only keeps accumulating for pairs still within
+    max_dist; entries above max_dist are partial sums, only good for rejecting the pair.
+    """
+    dist = _popcount_words(a[:, None, 0] ^ b[None, :, 0])
+    for w in range(1, a.shape[1]):
+        rows, cols = np.nonzero(dist <= max_dist)
+        if not len(rows):
+            break
+        dist[rows, cols] += _popcount_words(a[rows, w] ^ b[cols, w])
+    return dist
+
+
+if njit is not None:
+    # SWAR popcount constants; kept as uint64 so Numba never promotes to float64
+    _M1 = np.uint64(0x5555555555555555)
+    _M2 = np.uint64(0x3333333333333333)
+    _M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    _H01 = np.uint64(0x0101010101010101)
+    _S1 = np.uint64(1)
+    _S2 = np.uint64(2)
+    _S4 = np.uint64(4)
+    _S56 = np.uint64(56)
+
+    @njit(cache=True)
+    def _popcount64(x):
+        # LLVM recognizes this pattern and emits POPCNT where available
+        x = x - ((x >> _S1) & _M1)
+        x = (x & _M2) + ((x >> _S2) & _M2)
+        x = (x + (x >> _S4)) & _M4
+        return np.int64((x * _H01) >> _S56)
+
+    # The kernels are serial on purpose: they run on SearchThread's workers, and a
+    # parallel=True kernel launched from a non-main thread leaves Numba's thread pool
+    # blocking interpreter exit
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _hamming_block_numba(a, b, max_dist):
+        """
+        Distance matrix between every row of a (n, words) and b (m, words).
+        Stops summing a pair as soon as it exceeds max_dist, so entries above
+        max_dist are partial sums.
+        """
+        n = a.shape[0]
+        m = b.shape[0]
+        words = a.shape[1]
+        out = np.empty((n, m), dtype=np.uint16)
+        for i in range(n):
+            for j in range(m):
+                d = 0
+                for w in range(words):
+                    d += _popcount64(a[i, w] ^ b[j, w])
+                    if d > max_dist:
+                        break
+                out[i, j] = d
+        return out
+
+
+def _hamming_candidates_numpy(ref_mat: np.ndarray, work_mat: np.ndarray, is_: np.ndarray, js: np.ndarray, max_dist: int) -> np.ndarray:
+    """Distance of each candidate pair (ref_mat[is_[k]], work_mat[js[k]])."""
+    return _popcount_words(ref_mat[is_] ^ work_mat[js]).sum(axis=-1, dtype=np.uint16)
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _hamming_candidates_numba(ref_mat, work_mat, is_, js, max_dist):
+        """
+        Distance of each candidate pair (ref_mat[is_[k]], work_mat[js[k]]), without
+        gathering the rows first; like the block kernel, stops once over max_dist.
+        """
+        n = is_.shape[0]
+        words = ref_mat.shape[1]
+        out = np.empty(n, dtype=np.uint16)
+        for k in range(n):
+            i = is_[k]
+            j = js[k]
+            d = 0
+            for w in range(words):
+                d += _popcount64(ref_mat[i, w] ^ work_mat[j, w])
+                if d > max_dist:
+                    break
+            out[k] = d
+        return out
+
+
+def warm_up_hamming() -> None:
+    """
+    Compile (or load from Numba's on-disk cache) the Hamming kernels ahead of the first comparison.
+    A no-op without numba. The kernels are serial, so this never starts Numba's parallel
+    runtime and is safe to call from a worker thread while files are being scanned.
+    """
+    if njit is None:
+        return
+    try:
+        probe = np.zeros((1, 1), dtype=np.uint64)
+        index = np.zeros(1, dtype=np.int64)
+        _hamming_block_numba(probe, probe, 0)
+        _hamming_candidates_numba(probe, probe, index, index, 0)
+    except Exception:
+        logger.exception("Numba warm-up failed; the first comparison will compile instead")
+
+
+def _chunk_bounds(hash_bits: int, max_hamming: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Split the hash_bits positions into contiguous chunks for multi-index blocking.
+    With more chunks than max_hamming, two hashes within max_hamming bits agree exactly
+    on at least one chunk (pigeonhole). Returns None when the chunks would be too short
+    to be selective.
+    """
+    chunks = max(max_hamming + 1, -(-hash_bits // 32))
+    if hash_bits // chunks < BLOCKING_MIN_CHUNK_BITS:
+        return None
+    edges = np.linspace(0, hash_bits, chunks + 1).astype(int)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def _chunk_keys(mat: np.ndarray, hash_bits: int, bounds: List[Tuple[int, int]]) -> List[np.ndarray]:
+    """Integer key of every row of a packed hash matrix for each chunk in bounds."""
+    bits = np.unpackbits(mat.astype(">u8").view(np.uint8), axis=1)[:, -hash_bits:]
+    keys = []
+    for lo, hi in bounds:
+        weights = np.left_shift(np.int64(1), np.arange(hi - lo - 1, -1, -1, dtype=np.int64))
+        keys.append(bits[:, lo:hi].astype(np.int64) @ weights)
+    return keys
+
+
+def _block_candidates(ref_index, work_keys, start: int, stop: int, max_pairs: int):
+    """
+    (ref_indices, work_indices) of the pairs in work rows [start, stop) that share a chunk
+    key, ordered by work then ref index; None if there are more than max_pairs of them.
+    """
+    n_ref = len(ref_index[0][1])
+    codes = []
+    total = 0
+    for (sorted_keys, order), wk in zip(ref_index, work_keys):
+        keys = wk[start:stop]
+        lo = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - lo
+        n = int(counts.sum())
+        total += n
+        if total > max_pairs:
+            return None
+        if not n:
+            continue
+        js = np.repeat(np.arange(len(keys), dtype=np.int64), counts)
+        offsets = np.arange(n, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        is_ = order[np.repeat(lo, counts) + offsets]
+        codes.append(js * n_ref + is_)
+    if not codes:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # sort + adjacent compare: cheaper than np.unique, which hashes first on NumPy 2.x
+    codes = np.concatenate(codes)
+    codes.sort()
+    if len(codes) > 1:
+        codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+    return codes % n_ref, codes // n_ref + start
+
+
+def _hamming_pairs(
+    ref_mat: np.ndarray,
+    work_mat: np.ndarray,
+    max_hamming: int,
+    hash_bits: Optional[int] = None,
+) -> List[Tuple[int, int, int]]:
+    """
+    Return (ref_index, work_index, distance) for every pair of packed hash rows within
+    max_hamming bits, ordered by work index then ref index.
+
+    Distances are computed a block of work rows at a time with the Numba kernel when
+    numba is installed, otherwise with a vectorized NumPy XOR + popcount. Both work one
+    64-bit word at a time and drop a pair once it is over max_hamming.
+
+    For large inputs, pairs are first blocked by exact agreement on one of several hash
+    chunks (multi-index hashing, no misses); a block whose candidates are not much fewer
+    than all pairs falls back to the full comparison.
+    """
+    pairs: List[Tuple[int, int, int]] = []
+    if not len(ref_mat) or not len(work_mat):
+        return pairs
+
+    if njit is not None:
+        kernel = _hamming_block_numba
+        candidate_kernel = _hamming_candidates_numba
+        block = max(1, HAMMING_BLOCK_CELLS // len(ref_mat))
+    else:
+        # the NumPy path materializes a (rows, refs) uint64 XOR per word, so use smaller blocks
+        kernel = _hamming_block_numpy
+        candidate_kernel = _hamming_candidates_numpy
+        block = max(1, HAMMING_BLOCK_CELLS // (len(ref_mat) * 8))
+
+    hash_bits = hash_bits or ref_mat.shape[1] * 64
+    ref_index = work_keys = None
+    if len(ref_mat) * len(work_mat) >= BLOCKING_MIN_PAIRS:
+        bounds = _chunk_bounds(hash_bits, max_hamming)
+        if bounds is not None:
+            ref_index = []
+            for keys in _chunk_keys(ref_mat, hash_bits, bounds):
+                order = np.argsort(keys, kind="stable")
+                ref_index.append((keys[order], order))
+            work_keys = _chunk_keys(work_mat, hash_bits, bounds)
+
+    for start in range(0, len(work_mat), block):
+        stop = min(start + block, len(work_mat))
+        cand = None
+        if ref_index is not None:
+            cand = _block_candidates(ref_index, work_keys, start, stop, (stop - start) * len(ref_mat) // BLOCKING_MIN_GAIN)
+        if cand is not None:
+            is_, js = cand
+            dist = candidate_kernel(ref_mat, work_mat, is_, js, max_hamming)
+            keep = dist <= max_hamming
+            for i, j, d in zip(is_[keep].tolist(), js[keep].tolist(), dist[keep].tolist()):
+                pairs.append((i, j, d))
+            continue
+        dist = kernel(work_mat[start:stop], ref_mat, max_hamming)
+        js, is_ = np.nonzero(dist <= max_hamming)
+        for j, i in zip(js.tolist(), is_.tolist()):
+            pairs.append((i, start + j, int(dist[j, i])))
+    return pairs
+
+
+def _field_key_fn(fields: List[str]) -> Callable[[Any], Optional[tuple]]:
+    """
+    Build, once per search, a function returning the tuple of a file's values for the
+    selected compare fields ("name" is the basename), or None if any of them is unknown.
+    """
+    if "name" not in fields and len(fields) > 1:
+        # a multi-field attrgetter builds the whole tuple in C
+        fetch = operator.attrgetter(*fields)
+    else:
+        getters = []
+        for field in fields:
+            if field == "name":
+                getters.append(lambda f: os.path.basename(getattr(f, "path", "") or "") or None)
+            else:
+                getters.append(operator.attrgetter(field))
+
+        def fetch(f):
+            return tuple([g(f) for g in getters])
+
+    def key(f):
+        try:
+            values = fetch(f)
+        except AttributeError:
+            return None
+        return None if None in values else values
+
+    return key
+
+
 def _max_hamming_from_similarity(hash_bits: int, similarity_percent: float) -> int:
     # similarity_percent is e.g. 90.0 => max allowed hamming bits
     if similarity_percent <= 0:
@@ -99,9 +387,11 @@ def find_matches(
     ref_files: List[Any],
     work_files: List[Any],
     criteria: Dict[str, Any],
+    cache_path: Optional[str] = None,
 ) -> Tuple[List[Tuple[Any, Any, List[str]]], List[Any], List[Any]]:
     """
     Unified function that computes duplicate matches and uniques in one pass.
+    cache_path, when given, is the SQLite database holding the per-file hash cache (core/hash_cache.py).
 
     Returns a tuple: (matches, uniques_ref, uniques_work)
       - matches: List of (ref_obj, work_obj, [reasons])
@@ -110,14 +400,18 @@ def find_matches(
 
     Behavior:
     - If criteria['hash'] is truthy, uses hash-based comparison (fast).
-      * Hashing is done once for both sets using _compute_hashes_parallel which returns
-        canonical_path -> ImageHash. Canonicalization is performed by that helper.
-      * Hamming threshold is derived from criteria['similarity'] and criteria['hash_size'].
+      * Hashing is done once for both sets using _compute_packed_hashes which returns
+        canonical_path -> packed uint64 dhash row. Canonicalization is performed by that helper.
+      * Hamming threshold is derived from criteria['similarity'] and criteria['hash_size'],
+        unless criteria['max_hamming'] gives it explicitly.
       * Matching: compares everything with everything and records all matches (no early break).
       * uniques are determined by canonical-path membership in matched sets.
     - If criteria['hash'] is falsy, falls back to metadata (name/size) logic:
-      * matches: basename equality (same as previous non-hash behavior).
-      * uniques: determined by (basename, size) absence (same as previous non-hash).
+      * matches: equality on every field in criteria['fields'] ("name" = basename), found by
+        bucketing both sides on the field tuple; basename alone when no field is selected.
+        Fields the scanner never fills in (image_scanner.UNSCANNED_FIELDS) are ignored.
+      * uniques: files without a counterpart under the selected fields; with no field
+        selected, by (basename, size) absence (same as previous non-hash behavior).
     """
     matches: List[Tuple[Any, Any, List[str]]] = []
     uniques_ref: List[Any] = []
@@ -134,7 +428,10 @@ def find_matches(
     hash_size = int(criteria.get("hash_size") or DEFAULT_HASH_SIZE)
     similarity = float(criteria.get("similarity") or 90.0)
     hash_bits = hash_size * hash_size
-    max_hamming = _max_hamming_from_similarity(hash_bits, similarity)
+    if criteria.get("max_hamming") is not None:
+        max_hamming = int(criteria["max_hamming"])
+    else:
+        max_hamming = _max_hamming_from_similarity(hash_bits, similarity)
 
     logger.debug(
         "find_matches: use_hash=%s hash_size=%d similarity=%s%% -> max_hamming=%d",
@@ -145,32 +442,39 @@ def find_matches(
     )
 
     if not use_hash:
-        # Non-hash: matches by basename (old behavior), uniques by basename+size (old behavior)
-        ref_map_by_basename = {os.path.basename(f.path): f for f in ref_files if getattr(f, "path", None)}
-        for w in work_files:
-            name = os.path.basename(getattr(w, "path", ""))
-            ref = ref_map_by_basename.get(name)
-            if ref:
-                matches.append((ref, w, ["name"]))
-
-        # Uniques using (basename, size)
-        work_map = {}
-        for w in work_files:
-            key = (os.path.basename(getattr(w, "path", "")), getattr(w, "size", None))
-            work_map.setdefault(key, []).append(w)
-        for r in ref_files:
-            key = (os.path.basename(getattr(r, "path", "")), getattr(r, "size", None))
-            if key not in work_map:
-                uniques_ref.append(r)
-
-        ref_map = {}
-        for r in ref_files:
-            key = (os.path.basename(getattr(r, "path", "")), getattr(r, "size", None))
-            ref_map.setdefault(key, []).append(r)
-        for w in work_files:
-            key = (os.path.basename(getattr(w, "path", "")), getattr(w, "size", None))
-            if key not in ref_map:
-                uniques_work.append(w)
+        # Non-hash: matches by the selected compare fields (basename when none is selected).
+        # Every field must be equal, so bucket files by their field tuple and pair up
+        # buckets in O(N + M) instead of comparing every (ref, work) pair.
+        requested = list(criteria.get("fields") or [])
+        selected = [f for f in requested if f not in UNSCANNED_FIELDS]
+        if len(selected) < len(requested):
+            logger.debug("find_matches: ignoring unscanned fields %s", [f for f in requested if f in UNSCANNED_FIELDS])
+        fields = selected or ["name"]
+        field_key = _field_key_fn(fields)
+        ref_field_keys = [field_key(r) if getattr(r, "path", None) else None for r in ref_files]
+        work_field_keys = [field_key(w) for w in work_files]
+
+        ref_buckets: Dict[tuple, List[Any]] = defaultdict(list)
+        for r, k in zip(ref_files, ref_field_keys):
+            if k is not None:
+                ref_buckets[k].append(r)
+        work_key_set = {k for k in work_field_keys if k is not None}
+        for w, k in zip(work_files, work_field_keys):
+            for ref in ref_buckets.get(k, ()) if k is not None else ():
+                matches.append((ref, w, list(fields)))
+
+        if selected:
+            # Uniques: files with no counterpart under the same fields
+            uniques_ref.extend(r for r, k in zip(ref_files, ref_field_keys) if k is None or k not in work_key_set)
+            uniques_work.extend(w for w, k in zip(work_files, work_field_keys) if k is None or k not in ref_buckets)
+        else:
+            # Uniques using (basename, size) (old behavior)
+            ref_keys = [(os.path.basename(getattr(r, "path", "")), getattr(r, "size", None)) for r in ref_files]
+            work_keys = [(os.path.basename(getattr(w, "path", "")), getattr(w, "size", None)) for w in work_files]
+            work_key_set = set(work_keys)
+            uniques_ref.extend(r for r, key in zip(ref_files, ref_keys) if key not in work_key_set)
+            ref_key_set = set(ref_keys)
+            uniques_work.extend(w for w, key in zip(work_files, work_keys) if key not in ref_key_set)
 
         return matches, uniques_ref, uniques_work
 
@@ -196,55 +500,36 @@ def find_matches(
         work_canon_to_objs[canon].append(w)
         work_input_paths.append(p)
 
-    # Compute hashes (these return canonical_path -> ImageHash)
-    ref_hash_map = _compute_hashes_parallel(ref_input_paths, hash_size)
-    work_hash_map = _compute_hashes_parallel(work_input_paths, hash_size)
-
-    # Convert to integer bitmasks for fast hamming
-    ref_int_map: Dict[str, int] = {}
-    for canon_path, h in ref_hash_map.items():
-        try:
-            if h is not None:
-                ref_int_map[canon_path] = _imagehash_to_int(h)
-        except Exception:
-            logger.debug("Failed to convert ref hash to int for %s", canon_path)
-
-    work_int_map: Dict[str, int] = {}
-    for canon_path, h in work_hash_map.items():
-        try:
-            if h is not None:
-                work_int_map[canon_path] = _imagehash_to_int(h)
-        except Exception:
-            logger.debug("Failed to convert work hash to int for %s", canon_path)
+    # Compute hashes (these return canonical_path -> packed uint64 row)
+    ref_hash_map = _compute_packed_hashes(ref_input_paths, hash_size, cache_path)
+    if work_files is ref_files:
+        # same scan on both sides (one folder searched against itself): hash it once
+        work_hash_map = ref_hash_map
+    else:
+        work_hash_map = _compute_packed_hashes(work_input_paths, hash_size, cache_path)
 
     # For duplicate matching:
     matched_ref_canons = set()
     matched_work_canons = set()
 
-    # Compare everything-with-everything and record all matches (no early break)
-    # Iterate over each work object and compare it against all ref canonical hashes.
-    for w_obj in work_files:
-        wp = getattr(w_obj, "path", None)
-        if not wp:
-            continue
-        wp_canon = _normalize_path(wp)
-        if wp_canon not in work_int_map:
-            continue
-        wint = work_int_map[wp_canon]
-
-        # Compare with every ref canonical hash and record matches
-        for rp_canon, rint in ref_int_map.items():
-            try:
-                dist = _hamming_distance_int(rint, wint)
-            except Exception:
-                continue
-            if dist <= max_hamming:
-                # Record match(s) between all ref objects under rp_canon and this single work object
-                refs = ref_canon_to_objs.get(rp_canon, [])
-                for ref_obj in refs:
-                    matches.append((ref_obj, w_obj, [f"dhash:{dist}"]))
-                matched_ref_canons.add(rp_canon)
-                matched_work_canons.add(wp_canon)
+    # Compare every work hash against every ref hash and record all matches (no early break).
+    # Objects sharing a canonical path share one hash, so compare per canonical path (in input order).
+    ref_canons = [c for c in ref_canon_to_objs if ref_hash_map.get(c) is not None]
+    work_canons = [c for c in work_canon_to_objs if work_hash_map.get(c) is not None]
+    # Stack the packed rows once; every comparison is then XOR + popcount
+    ref_mat = _stack_rows([ref_hash_map[c] for c in ref_canons], hash_bits)
+    work_mat = _stack_rows([work_hash_map[c] for c in work_canons], hash_bits)
+
+    for i, j, dist in _hamming_pairs(ref_mat, work_mat, max_hamming, hash_bits):
+        rp_canon = ref_canons[i]
+        wp_canon = work_canons[j]
+        # Record match(s) between all ref objects under rp_canon and all work objects under wp_canon
+        refs = ref_canon_to_objs.get(rp_canon, [])
+        for w_obj in work_canon_to_objs[wp_canon]:
+            for ref_obj in refs:
+                matches.append((ref_obj, w_obj, [f"dhash:{dist}"]))
+        matched_ref_canons.add(rp_canon)
+        matched_work_canons.add(wp_canon)
 
     # Compute uniques: objects whose canonical paths were not matched
     for canon, ref_objs in ref_canon_to_objs.items():
@@ -0,0 +1,99 @@
+"""
+core/hash_cache.py
+
+Per-file SQLite cache of packed dhash rows, keyed by (path, hash_type, hash_size) and
+validated against the file's size and mtime_ns.
+
+Provides:
+- init_db(conn) -> creates the hash_cache table if needed.
+- load_hashes(conn, stats, hash_size) -> canonical path -> packed uint64 row for unchanged files
+- store_hashes(conn, rows, stats, hash_size) -> upserts the given rows in one transaction
+
+Notes:
+- `stats` maps canonical path -> (size, mtime_ns) as stat()ed by the caller just before the
+  lookup; a row is only returned when both still match, so an edited file simply misses.
+- Rows are stored as the raw bytes of their uint64 words and read back with np.frombuffer.
+- hash_type is fast_hash.HASH_TYPE; changing how the grid is computed changes it, so rows
+  produced the old way are never mixed with new ones.
+- The table lives in the scan cache database next to scans and meta (see scan_cache).
+"""
+
+import logging
+import sqlite3
+from typing import Dict, Tuple
+
+import numpy as np
+
+from core.fast_hash import HASH_TYPE
+
+logger = logging.getLogger(__name__)
+
+# Host parameters per SELECT ... IN (...) query (SQLite's historical limit is 999)
+_LOOKUP_CHUNK = 500
+
+_HASH_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS hash_cache (
+  path TEXT NOT NULL,
+  hash_type TEXT NOT NULL,
+  hash_size INTEGER NOT NULL,
+  size INTEGER NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  hash BLOB NOT NULL,
+  PRIMARY KEY (path, hash_type, hash_size)
+);
+"""
+
+
+def init_db(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the hash_cache table exists and WAL journaling is on. Idempotent.
+    """
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute(_HASH_TABLE_DDL)
+    conn.commit()
+
+
+def load_hashes(conn: sqlite3.Connection, stats: Dict[str, Tuple[int, int]], hash_size: int) -> Dict[str, np.ndarray]:
+    """
+    Return canonical path -> packed uint64 row for every path in stats whose cached
+    size and mtime_ns are unchanged.
+    """
+    paths = list(stats)
+    found: Dict[str, np.ndarray] = {}
+    cur = conn.cursor()
+    for start in range(0, len(paths), _LOOKUP_CHUNK):
+        chunk = paths[start:start + _LOOKUP_CHUNK]
+        cur.execute(
+            "SELECT path, size, mtime_ns, hash FROM hash_cache WHERE hash_type = ? AND hash_size = ? AND path IN (%s)"
+            % ",".join("?" * len(chunk)),
+            (HASH_TYPE, int(hash_size), *chunk),
+        )
+        for path, size, mtime_ns, blob in cur.fetchall():
+            if stats.get(path) == (size, mtime_ns):
+                found[path] = np.frombuffer(blob, dtype=np.uint64)
+    return found
+
+
+def store_hashes(
+    conn: sqlite3.Connection,
+    rows: Dict[str, np.ndarray],
+    stats: Dict[str, Tuple[int, int]],
+    hash_size: int,
+) -> None:
+    """
+    Insert or replace the cached rows (canonical path -> packed row) in a single transaction.
+    Paths missing from stats are skipped.
+    """
+    records = [
+        (path, HASH_TYPE, int(hash_size), stats[path][0], stats[path][1], sqlite3.Binary(np.ascontiguousarray(row, dtype=np.uint64).tobytes()))
+        for path, row in rows.items()
+        if path in stats
+    ]
+    if not records:
+        return
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO hash_cache (path, hash_type, hash_size, size, mtime_ns, hash) VALUES (?, ?, ?, ?, ?, ?)",
+            records,
+        )
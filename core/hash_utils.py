@@ -3,9 +3,12 @@ import os
 import logging
 from typing import List, Dict, Optional
 import concurrent.futures
+import sqlite3
 
-from PIL import Image, UnidentifiedImageError
-import imagehash
+import numpy as np
+
+from core import hash_cache
+from core.fast_hash import dhash_batch, dhash_pixels
 
 logger = logging.getLogger(__name__)
 
@@ -34,37 +37,10 @@ def _normalize_path(p: str) -> str:
     return rp_str
 
 
-def _hash_one(path: str, hash_size: int) -> Optional[imagehash.ImageHash]:
-    """
-    Compute dhash for a single file path. Returns None on failure.
+def _canonical_inputs(paths: List[str]) -> Dict[str, str]:
     """
-    try:
-        with Image.open(path) as im:
-            # imagehash will handle mode conversions as necessary
-            return imagehash.dhash(im, hash_size=hash_size)
-    except (UnidentifiedImageError, OSError, ValueError) as e:
-        logger.debug("Cannot open image for hashing %s: %s", path, e)
-        return None
-    except Exception as e:
-        logger.exception("Unexpected error hashing image %s: %s", path, e)
-        return None
-
-
-def _compute_hashes_parallel(paths: List[str], hash_size: int) -> Dict[str, imagehash.ImageHash]:
+    Map canonical path -> first original input path resolving to it (so each file is read once).
     """
-    Compute image hashes for a list of file paths in parallel.
-
-    IMPORTANT: This function normalizes/ canonicalizes keys before computing and returns a
-    mapping keyed by canonical (normalized) paths. Duplicate input paths that resolve to the
-    same canonical path are deduplicated so the file is hashed only once.
-
-    Returns:
-        Dict[canonical_path -> imagehash.ImageHash]
-    """
-    if not paths:
-        return {}
-
-    # Build mapping from canonical path -> one representative original path (for reading)
     canon_to_original: Dict[str, str] = {}
     for p in paths:
         if not p:
@@ -77,31 +53,88 @@ def _compute_hashes_parallel(paths: List[str], hash_size: int) -> Dict[str, imag
         # Keep first observed original path for this canonical path (saves duplicate hashing)
         if canon not in canon_to_original:
             canon_to_original[canon] = p
+    return canon_to_original
 
-    canon_paths = list(canon_to_original.keys())
-    to_compute = [canon_to_original[canon] for canon in canon_paths]
 
-    logger.debug("Computing hashes for %d unique canonical paths (from %d inputs)", len(canon_paths), len(paths))
+def _open_hash_cache(cache_path: str) -> Optional[sqlite3.Connection]:
+    """Open the hash cache database at cache_path, or return None (hashing then runs uncached)."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        conn = sqlite3.connect(cache_path)
+        hash_cache.init_db(conn)
+        return conn
+    except Exception:
+        logger.exception("Cannot open hash cache %s; hashing without cache", cache_path)
+        return None
 
-    results: Dict[str, imagehash.ImageHash] = {}
 
-    # ThreadPool is fine because PIL image IO is I/O bound
-    max_workers = min(32, (os.cpu_count() or 1) + 4)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as exe:
-        future_to_canon = {
-            exe.submit(_hash_one, orig_path, hash_size): canon
-            for canon, orig_path in canon_to_original.items()
-        }
+def _compute_packed_hashes(paths: List[str], hash_size: int, cache_path: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute image hashes for a list of file paths, keyed by canonical (normalized) path,
+    as packed uint64 dhash rows (see fast_hash.dhash_batch). Inputs resolving to the same
+    canonical path are hashed once. Files are decoded in parallel; the bits are computed
+    for all of them in one vectorized pass.
+
+    With cache_path, rows of files whose (size, mtime_ns) are unchanged are read from the
+    hash cache at that SQLite database instead, and newly computed rows are stored there.
+    """
+    if not paths:
+        return {}
 
-        for fut in concurrent.futures.as_completed(future_to_canon):
-            canon = future_to_canon[fut]
+    canon_to_original = _canonical_inputs(paths)
+    results: Dict[str, np.ndarray] = {}
+    conn = _open_hash_cache(cache_path) if cache_path else None
+    stats: Dict[str, tuple] = {}
+    try:
+        if conn is not None:
+            for canon, orig_path in canon_to_original.items():
+                try:
+                    st = os.stat(orig_path)
+                except OSError:
+                    continue
+                stats[canon] = (st.st_size, st.st_mtime_ns)
             try:
-                h = fut.result()
-                if h is not None:
-                    results[canon] = h
-                else:
-                    logger.debug("Hash computation returned None for %s", canon)
+                results = hash_cache.load_hashes(conn, stats, hash_size)
             except Exception:
-                logger.exception("Exception computing hash for %s", canon)
-
-    return results
\ No newline at end of file
+                logger.exception("Hash cache lookup failed")
+
+        to_compute = {c: p for c, p in canon_to_original.items() if c not in results}
+        logger.debug(
+            "Computing packed hashes for %d of %d unique canonical paths (from %d inputs; %d cached)",
+            len(to_compute), len(canon_to_original), len(paths), len(results),
+        )
+        if not to_compute:
+            return results
+
+        grids: Dict[str, np.ndarray] = {}
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as exe:
+            future_to_canon = {
+                exe.submit(dhash_pixels, orig_path, hash_size): canon
+                for canon, orig_path in to_compute.items()
+            }
+            for fut in concurrent.futures.as_completed(future_to_canon):
+                canon = future_to_canon[fut]
+                try:
+                    grid = fut.result()
+                    if grid is not None:
+                        grids[canon] = grid
+                    else:
+                        logger.debug("Hash computation returned None for %s", canon)
+                except Exception:
+                    logger.exception("Exception computing hash for %s", canon)
+
+        if not grids:
+            return results
+        canons = list(grids)
+        computed = dict(zip(canons, dhash_batch(np.stack([grids[c] for c in canons]))))
+        results.update(computed)
+        if conn is not None:
+            try:
+                hash_cache.store_hashes(conn, computed, stats, hash_size)
+            except Exception:
+                logger.exception("Failed to store hash cache")
+        return results
+    finally:
+        if conn is not None:
+            conn.close()
@@ -10,17 +10,40 @@ Changes in this patch:
   - quick extension whitelist to avoid trying to open non-images.
 - Attempts to read basic metadata (size, mtime, dimensions, mode) with PIL where possible,
   but failures to decode are handled gracefully and logged.
-- Exposes scan_images_in_directory(path) and an ImageFileObj dataclass used by the rest of the app.
+- Dimensions follow the EXIF Orientation tag, read from the header in every scan; need_exif only
+  separates scans (and their caches) that compare the other EXIF-dependent fields.
+- Unchanged files (same size and mtime) can be reused from a previous scan (known=...).
+- Walks the tree with os.scandir and stats each candidate once, reusing that stat for
+  size/mtime/created.
+- Opens files with PIL on a thread pool and can report per-file progress.
+- Exposes scan_images_in_directory(path, need_exif, known) and an ImageFileObj dataclass used by the rest of the app;
+  ImageFileObj.meta gives its metadata as a dict, built once per object.
 """
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
-from PIL import Image, ImageOps, UnidentifiedImageError
+from typing import Any, Callable, Dict, List, Optional
+from PIL import Image, UnidentifiedImageError
 
 logger = logging.getLogger(__name__)
 
+# Criteria fields whose values depend on EXIF data beyond the Orientation tag, which is always
+# read (dimensions follow it). need_exif keys scans by these; see UNSCANNED_FIELDS below.
+EXIF_DEPENDENT_FIELDS = ("datetime_original", "artist", "copyright", "make", "model", "origin")
+
+# ImageFileObj fields the scanner never fills in (always None); the comparator leaves them out
+# of metadata matching, where an unknown value would keep every file from matching
+UNSCANNED_FIELDS = ("datetime_original", "artist", "copyright", "make", "model", "image_description", "origin")
+
+# EXIF Orientation tag, and the values whose upright image has width and height swapped
+_EXIF_ORIENTATION = 0x0112
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+# Threads opening files with PIL during a scan
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 # Quick extension whitelist (lowercase)
 IMAGE_EXTENSIONS = {
     ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif", ".webp", ".heic", ".heif"
@@ -45,35 +68,95 @@ class ImageFileObj:
     image_description: Optional[str] = None
     origin: Optional[str] = None
 
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Field name -> value for display (e.g. the comparison dialog); built once per object."""
+        meta = self.__dict__.get("_meta")
+        if meta is None:
+            meta = {
+                "name": self.name,
+                "size": self.size,
+                "path": self.path,
+                "dimensions": self.dimensions,
+                "mode": self.mode,
+                "mtime": self.mtime,
+                "created": self.created,
+                "datetime_original": self.datetime_original,
+                "artist": self.artist,
+                "copyright": self.copyright,
+                "make": self.make,
+                "model": self.model,
+                "image_description": self.image_description,
+                "origin": self.origin,
+            }
+            # stored outside the dataclass fields so it stays out of eq/repr
+            self.__dict__["_meta"] = meta
+        return meta
 
-def _is_probable_image(path: Path) -> bool:
-    name = path.name
+
+def _is_probable_image_name(name: str) -> bool:
+    """Junk-name and extension checks that need no syscall."""
     # Skip macOS resource fork files and dot-underscore files
     if name.startswith("._"):
         return False
     # Skip hidden system files like Thumbs.db
-    if name.lower() in {"thumbs.db", ".ds_store"}:
+    lower = name.lower()
+    if lower in {"thumbs.db", ".ds_store"}:
+        return False
+    # Quick extension check; no extension: let PIL decide but that is rare
+    ext = os.path.splitext(lower)[1]
+    if ext and ext not in IMAGE_EXTENSIONS:
         return False
+    return True
+
+
+def _walk_files(top: str):
+    """
+    Yield os.DirEntry objects for the files below top, in os.walk's top-down order.
+    DirEntry caches the type from the directory read (and the stat on Windows), so
+    listing costs no per-entry stat calls; symlinked directories are not followed.
+    """
+    subdirs = []
     try:
-        if path.stat().st_size == 0:
-            return False
+        with os.scandir(top) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                yield entry
+    except OSError as e:
+        logger.debug("Cannot list directory %s: %s", top, e)
+        return
+    for d in subdirs:
+        yield from _walk_files(d)
+
+
+def _header_orientation(im: Image.Image) -> Optional[int]:
+    """
+    EXIF Orientation from the metadata read with the header, or None. Unlike im.getexif(),
+    this never loads pixel data (PngImageFile.getexif decodes the image to find a late eXIf chunk).
+    TIFFs are left out: Pillow already reports their size upright.
+    """
+    raw = im.info.get("exif")  # JPEG APP1, PNG eXIf, WebP EXIF chunk
+    if not raw or im.format == "TIFF":
+        return None
+    try:
+        exif = Image.Exif()
+        exif.load(raw)
+        return exif.get(_EXIF_ORIENTATION)
     except Exception:
-        # If we can't stat, let later PIL decide
-        pass
-    # Quick extension check
-    if path.suffix:
-        if path.suffix.lower() not in IMAGE_EXTENSIONS:
-            return False
-    else:
-        # no extension; let PIL decide but that is rare
-        return True
-    return True
+        return None
 
 
-def _try_read_image_info(path: str) -> Optional[ImageFileObj]:
+def _try_read_image_info(path: str, need_exif: bool = True, st: Optional[os.stat_result] = None) -> Optional[ImageFileObj]:
     p = Path(path)
     try:
-        st = p.stat()
+        if st is None:
+            st = p.stat()
         size = st.st_size
         mtime = st.st_mtime
         created = getattr(st, "st_ctime", None)
@@ -87,15 +170,15 @@ def _try_read_image_info(path: str) -> Optional[ImageFileObj]:
         logger.debug("Skipping zero-size file %s", path)
         return None
 
-    # Try to open with PIL to get dimensions/mode
+    # Try to open with PIL to get dimensions/mode (header only, pixels are never decoded)
     try:
         with Image.open(path) as im:
-            try:
-                im = ImageOps.exif_transpose(im)
-            except Exception:
-                pass
             width, height = im.size
             mode = im.mode
+            # dimensions as exif_transpose would report them, in both modes so rotated photos
+            # never show (and cache) their stored width x height
+            if _header_orientation(im) in _TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
     except (UnidentifiedImageError, OSError, ValueError) as e:
         # Not a decodable image
         logger.debug("Cannot open image %s: %s", path, e)
@@ -115,33 +198,70 @@ def _try_read_image_info(path: str) -> Optional[ImageFileObj]:
     )
 
 
-def scan_images_in_directory(root: str) -> List[ImageFileObj]:
+def scan_images_in_directory(
+    root: str,
+    need_exif: bool = True,
+    known: Optional[Dict[str, ImageFileObj]] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[ImageFileObj]:
     """
     Recursively scan `root` for image files and return a list of ImageFileObj.
     Applies quick extension-based filtering and excludes obvious junk files early.
+    Dimensions are reported upright (EXIF Orientation applied) whatever need_exif is.
+    `known` maps path -> ImageFileObj from an earlier scan; entries whose size and mtime
+    are unchanged are reused instead of re-opening the file with PIL.
+    Files are opened with PIL on a thread pool; `progress(done, total)` is called from
+    those threads as files complete.
     """
-    out: List[ImageFileObj] = []
+    out: List[Optional[ImageFileObj]] = []
     if not root:
-        return out
+        return []
     root_p = Path(root)
     if not root_p.exists():
-        return out
-
-    for dirpath, dirnames, filenames in os.walk(root_p):
-        for fn in filenames:
-            p = Path(dirpath) / fn
-            try:
-                if not _is_probable_image(p):
-                    logger.debug("Filtered out non-image or junk file: %s", p)
-                    continue
-                info = _try_read_image_info(str(p))
-                if info:
-                    out.append(info)
-                else:
-                    # _try_read_image_info already logged the reason
-                    continue
-            except Exception as e:
-                logger.debug("Skipping file due to unexpected error %s: %s", p, e)
+        return []
+
+    # (slot in out, path, stat) for every file that has to be opened with PIL
+    pending = []
+    for entry in _walk_files(str(root_p)):
+        path = entry.path
+        try:
+            # name checks first so non-images never cost a stat call
+            if not _is_probable_image_name(entry.name):
+                logger.debug("Filtered out non-image or junk file: %s", path)
+                continue
+            st = entry.stat()
+            if st.st_size == 0:
+                logger.debug("Filtered out zero-byte file: %s", path)
                 continue
-    logger.info("Scanned %d image(s) in %s", len(out), root)
-    return out
+            if known:
+                prev = known.get(path)
+                if prev is not None and prev.size == st.st_size and prev.mtime == st.st_mtime:
+                    out.append(prev)
+                    continue
+            pending.append((len(out), path, st))
+            out.append(None)
+        except Exception as e:
+            logger.debug("Skipping file due to unexpected error %s: %s", path, e)
+            continue
+
+    total = len(out)
+    done = total - len(pending)
+    if progress:
+        progress(done, total)
+    if pending:
+        # PIL header reads are I/O bound and release the GIL while waiting on the disk
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as exe:
+            future_to_slot = {exe.submit(_try_read_image_info, path, need_exif, st): slot for slot, path, st in pending}
+            for fut in as_completed(future_to_slot):
+                try:
+                    # None when the file is not a decodable image (already logged)
+                    out[future_to_slot[fut]] = fut.result()
+                except Exception as e:
+                    logger.debug("Skipping file due to unexpected error: %s", e)
+                done += 1
+                if progress:
+                    progress(done, total)
+
+    files = [f for f in out if f is not None]
+    logger.info("Scanned %d image(s) in %s", len(files), root)
+    return files
@@ -0,0 +1,90 @@
+"""
+core/metadata_cache.py
+
+Per-file SQLite cache of ImageFileObj metadata, keyed by (path, need_exif) and
+validated against the file's size and mtime.
+
+Provides:
+- init_db(conn) -> creates the meta table if needed.
+- load_known(conn, root, need_exif) -> path -> ImageFileObj for every cached file under root
+- store_entries(conn, files, need_exif) -> upserts the given files in one transaction
+
+Notes:
+- scan_cache keeps whole scans per root; this table is what lets a folder that was never
+  scanned as a root (a sub-folder, a parent, a renamed root) reuse metadata read before.
+- The dict returned by load_known is passed to scan_images_in_directory(known=...), which
+  re-stats each file and only reuses entries whose size and mtime are unchanged, so an
+  edited file simply misses.
+- Hashes are not stored here; core/hash_cache.py already caches them per canonical path and hash size.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from core.image_scanner import ImageFileObj
+
+logger = logging.getLogger(__name__)
+
+_META_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS meta (
+  path TEXT NOT NULL,
+  need_exif INTEGER NOT NULL,
+  size INTEGER NULL,
+  mtime REAL NULL,
+  seen_at INTEGER NOT NULL,
+  info BLOB NOT NULL,
+  PRIMARY KEY (path, need_exif)
+);
+"""
+
+
+def init_db(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the meta table exists and WAL journaling is on. Idempotent.
+    """
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute(_META_TABLE_DDL)
+    conn.commit()
+
+
+def load_known(conn: sqlite3.Connection, root: str, need_exif: bool) -> Dict[str, ImageFileObj]:
+    """
+    Return path -> ImageFileObj for all cached files below root (paths as the scanner builds them).
+    """
+    prefix = str(Path(root))
+    if not prefix.endswith(os.sep):
+        prefix += os.sep
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT path, info FROM meta WHERE need_exif = ? AND path >= ? AND path < ?",
+        (int(need_exif), prefix, prefix + "\uffff"),
+    )
+    known: Dict[str, ImageFileObj] = {}
+    for path, blob in cur.fetchall():
+        try:
+            known[path] = pickle.loads(blob)
+        except Exception:
+            logger.debug("Dropping corrupt metadata cache entry for %s", path)
+    return known
+
+
+def store_entries(conn: sqlite3.Connection, files: List[ImageFileObj], need_exif: bool) -> None:
+    """
+    Insert or replace the cached metadata for files in a single transaction.
+    """
+    now = int(time.time())
+    rows = [
+        (f.path, int(need_exif), f.size, f.mtime, now, sqlite3.Binary(pickle.dumps(f, protocol=pickle.HIGHEST_PROTOCOL)))
+        for f in files
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (path, need_exif, size, mtime, seen_at, info) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
@@ -0,0 +1,250 @@
+"""
+core/scan_cache.py
+
+Persistent SQLite cache for scan_images_in_directory results.
+
+Provides:
+- directory_fingerprint(root) -> str: sha1 over the root path and the newest change time, entry
+  count and total file size of its tree.
+- init_db(conn) -> creates the scans table if needed.
+- load_scan(conn, root, need_exif, fingerprint) -> cached List[ImageFileObj] or None
+- load_previous_scan(conn, root, need_exif) -> last stored List[ImageFileObj] regardless of fingerprint
+- store_scan(conn, root, need_exif, fingerprint, files) -> upserts the scan for root
+- cached_scan(root, cache_path, need_exif, progress) -> List[ImageFileObj], scanning only when the tree changed
+
+Notes:
+- One row is kept per (canonical root directory, need_exif); a changed fingerprint replaces it.
+- The fingerprint only needs a stat() walk, which is far cheaper than re-opening every
+  image with PIL, so repeat searches on an unchanged folder skip the decode pass entirely.
+  Its limit: it is a summary, not a per-file record. A change that keeps the entry count and
+  total size and leaves every mtime and st_ctime at or below the newest one goes unnoticed.
+  On POSIX st_ctime is set by the kernel on every write, so that takes a clock going
+  backwards. On Windows, where st_ctime is the creation time, a file overwritten in place by
+  one of the same size that keeps an older mtime (e.g. a restore from backup) is missed.
+- When the fingerprint changed, the previous scan is used as a per-file memo so only files
+  whose (path, size, mtime) changed are re-opened. A root with no previous scan falls back
+  to the per-file metadata_cache table stored in the same database.
+- The most recent scans are also kept in memory (MEMORY_CACHE_SIZE entries) so repeat
+  searches in one session skip unpickling as well.
+- SCAN_CACHE_VERSION is mixed into the fingerprint and stored as the database's user_version;
+  bump it whenever ImageFileObj changes shape or meaning. init_db then empties the scans and
+  meta tables, so no old entry is reused as a per-file memo either.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from core import metadata_cache
+from core.hash_utils import _normalize_path
+from core.image_scanner import ImageFileObj, scan_images_in_directory
+
+logger = logging.getLogger(__name__)
+
+SCAN_CACHE_VERSION = 2
+
+# Number of (root, need_exif) scans kept in memory for the current session
+MEMORY_CACHE_SIZE = 8
+
+# (root, need_exif) -> (fingerprint, files); most recently used last
+_memory_cache: "OrderedDict[Tuple[str, bool], Tuple[str, List[ImageFileObj]]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+# Default location, next to the application log file (see main.py)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".unique_image_finder", "scan_cache.db")
+
+_SCANS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS scans (
+  root TEXT NOT NULL,
+  need_exif INTEGER NOT NULL,
+  fingerprint TEXT NOT NULL,
+  scanned_at INTEGER NOT NULL,
+  files BLOB NOT NULL,
+  PRIMARY KEY (root, need_exif)
+);
+"""
+
+
+def directory_fingerprint(root: str) -> str:
+    """
+    Return a key that changes whenever anything under root is added, removed or modified.
+    Combines the canonical root path, the newest mtime or st_ctime in the tree, the entry
+    count and the total file size (see the Notes for what it can miss).
+    """
+    newest = 0.0
+    count = 0
+    total_size = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            st = os.stat(current)
+            newest = max(newest, st.st_mtime, st.st_ctime)
+            with os.scandir(current) as it:
+                for entry in it:
+                    count += 1
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            # st_ctime also moves when a file is replaced with an older mtime
+                            st = entry.stat()
+                            newest = max(newest, st.st_mtime, st.st_ctime)
+                            total_size += st.st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    raw = f"{SCAN_CACHE_VERSION}|{_normalize_path(root)}|{newest}|{count}|{total_size}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def init_db(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the scans table exists and WAL journaling is on, dropping scans and per-file
+    metadata (metadata_cache's meta table) stored by an older SCAN_CACHE_VERSION. Idempotent.
+    """
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    if cur.execute("PRAGMA user_version;").fetchone()[0] != SCAN_CACHE_VERSION:
+        cur.execute("DROP TABLE IF EXISTS scans;")
+        cur.execute("DROP TABLE IF EXISTS meta;")
+        cur.execute(f"PRAGMA user_version = {SCAN_CACHE_VERSION};")
+    cur.execute(_SCANS_TABLE_DDL)
+    conn.commit()
+
+
+def load_scan(conn: sqlite3.Connection, root: str, need_exif: bool, fingerprint: str) -> Optional[List[ImageFileObj]]:
+    """
+    Return the cached scan for root if it was stored under the same fingerprint, else None.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT fingerprint, files FROM scans WHERE root = ? AND need_exif = ?",
+        (_normalize_path(root), int(need_exif)),
+    )
+    row = cur.fetchone()
+    if not row or row[0] != fingerprint:
+        return None
+    try:
+        return pickle.loads(row[1])
+    except Exception:
+        logger.exception("Corrupt scan cache entry for %s; rescanning", root)
+        return None
+
+
+def load_previous_scan(conn: sqlite3.Connection, root: str, need_exif: bool) -> Optional[List[ImageFileObj]]:
+    """
+    Return the last stored scan for root whatever its fingerprint (used as a per-file memo), else None.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT files FROM scans WHERE root = ? AND need_exif = ?",
+        (_normalize_path(root), int(need_exif)),
+    )
+    row = cur.fetchone()
+    if not row:
+        return None
+    try:
+        return pickle.loads(row[0])
+    except Exception:
+        return None
+
+
+def _remember(key: Tuple[str, bool], fingerprint: str, files: List[ImageFileObj]) -> None:
+    with _memory_lock:
+        _memory_cache[key] = (fingerprint, files)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def store_scan(conn: sqlite3.Connection, root: str, need_exif: bool, fingerprint: str, files: List[ImageFileObj]) -> None:
+    """
+    Insert or replace the cached scan for root.
+    """
+    blob = pickle.dumps(files, protocol=pickle.HIGHEST_PROTOCOL)
+    conn.execute(
+        "INSERT OR REPLACE INTO scans (root, need_exif, fingerprint, scanned_at, files) VALUES (?, ?, ?, ?, ?)",
+        (_normalize_path(root), int(need_exif), fingerprint, int(time.time()), sqlite3.Binary(blob)),
+    )
+    conn.commit()
+
+
+def cached_scan(
+    root: str,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    need_exif: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[ImageFileObj]:
+    """
+    scan_images_in_directory(root, need_exif) backed by the on-disk cache at cache_path.
+    Any cache failure falls back to a plain scan; the cache never blocks scanning.
+    `progress(done, total)` is forwarded to the scanner, and called once with (n, n) on a cache hit.
+    """
+    if not root or not cache_path or not os.path.isdir(root):
+        return scan_images_in_directory(root, need_exif, progress=progress)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        conn = sqlite3.connect(cache_path)
+    except Exception:
+        logger.exception("Cannot open scan cache %s; scanning without cache", cache_path)
+        return scan_images_in_directory(root, need_exif, progress=progress)
+
+    key = (_normalize_path(root), bool(need_exif))
+    try:
+        try:
+            init_db(conn)
+            metadata_cache.init_db(conn)
+            fingerprint = directory_fingerprint(root)
+            with _memory_lock:
+                entry = _memory_cache.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                logger.info("Scan memory cache hit for %s (%d image(s))", root, len(entry[1]))
+                if progress:
+                    progress(len(entry[1]), len(entry[1]))
+                return entry[1]
+            files = load_scan(conn, root, need_exif, fingerprint)
+        except Exception:
+            logger.exception("Scan cache lookup failed for %s", root)
+            fingerprint, files = None, None
+
+        if files is not None:
+            logger.info("Scan cache hit for %s (%d image(s))", root, len(files))
+            _remember(key, fingerprint, files)
+            if progress:
+                progress(len(files), len(files))
+            return files
+
+        # Tree changed: reuse entries for files whose size/mtime did not change
+        known = None
+        if fingerprint is not None:
+            try:
+                with _memory_lock:
+                    entry = _memory_cache.get(key)
+                previous = entry[1] if entry is not None else load_previous_scan(conn, root, need_exif)
+                if previous:
+                    known = {f.path: f for f in previous}
+                else:
+                    known = metadata_cache.load_known(conn, root, need_exif) or None
+            except Exception:
+                logger.exception("Failed to load previous scan for %s", root)
+
+        files = scan_images_in_directory(root, need_exif, known, progress)
+        if fingerprint is not None:
+            _remember(key, fingerprint, files)
+            try:
+                store_scan(conn, root, need_exif, fingerprint, files)
+                metadata_cache.store_entries(conn, files, need_exif)
+            except Exception:
+                logger.exception("Failed to store scan cache for %s", root)
+        return files
+    finally:
+        conn.close()
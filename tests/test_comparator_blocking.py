@@ -0,0 +1,64 @@
+"""
+Multi-index blocking in _hamming_pairs must find exactly the pairs a brute-force
+comparison finds, with either kernel.
+"""
+
+import numpy as np
+import pytest
+
+from core import comparator
+
+
+def _brute_force(ref_mat: np.ndarray, work_mat: np.ndarray, max_hamming: int):
+    ref_bits = np.unpackbits(ref_mat.astype(">u8").view(np.uint8), axis=1)
+    work_bits = np.unpackbits(work_mat.astype(">u8").view(np.uint8), axis=1)
+    dist = (work_bits[:, None, :] != ref_bits[None, :, :]).sum(axis=-1)
+    js, is_ = np.nonzero(dist <= max_hamming)
+    return sorted(zip(is_.tolist(), js.tolist(), dist[js, is_].tolist()))
+
+
+def _rows(rng: np.random.Generator, words: int, max_hamming: int):
+    ref_mat = rng.integers(0, 2**64, size=(300, words), dtype=np.uint64)
+    ref_mat[1] = ref_mat[0]  # a repeated reference hash matches the same work rows twice
+    work_mat = rng.integers(0, 2**64, size=(200, words), dtype=np.uint64)
+    # near copies of reference rows, from exact to just over the threshold
+    bits = words * 64
+    for j in range(60):
+        row = np.unpackbits(ref_mat[rng.integers(0, 300)].astype(">u8").view(np.uint8))
+        flips = rng.choice(bits, size=min(bits, int(rng.integers(0, max_hamming + 3))), replace=False)
+        row[flips] ^= 1
+        work_mat[j] = np.packbits(row).view(">u8").astype(np.uint64)
+    return ref_mat, work_mat
+
+
+KERNELS = ["numpy"] + (["numba"] if comparator.njit is not None else [])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("words", [1, 4])
+@pytest.mark.parametrize("max_hamming", [0, 3, 26])
+def test_blocked_pairs_match_brute_force(monkeypatch, kernel, words, max_hamming):
+    if kernel == "numpy":
+        monkeypatch.setattr(comparator, "njit", None)
+    # block every input, with chunks of any width, and always use the candidates
+    # (lifting the max_pairs fallback, which short 64-bit chunks would hit at 26)
+    monkeypatch.setattr(comparator, "BLOCKING_MIN_PAIRS", 0)
+    monkeypatch.setattr(comparator, "BLOCKING_MIN_CHUNK_BITS", 1)
+    blocked_calls = []
+    block_candidates = comparator._block_candidates
+
+    def spy(ref_index, work_keys, start, stop, max_pairs):
+        cand = block_candidates(ref_index, work_keys, start, stop, np.iinfo(np.int64).max)
+        blocked_calls.append(cand is not None)
+        return cand
+
+    monkeypatch.setattr(comparator, "_block_candidates", spy)
+
+    ref_mat, work_mat = _rows(np.random.default_rng(words * 100 + max_hamming), words, max_hamming)
+    expected = _brute_force(ref_mat, work_mat, max_hamming)
+
+    pairs = comparator._hamming_pairs(ref_mat, work_mat, max_hamming, words * 64)
+
+    assert blocked_calls and all(blocked_calls)
+    assert sorted(pairs) == expected
+    assert len(expected) >= 10
@@ -0,0 +1,62 @@
+"""
+Regression check: running the Hamming kernels from worker threads (as SearchThread does)
+must not keep the interpreter from exiting.
+"""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_SEARCH_SCRIPT = textwrap.dedent(
+    """
+    import threading
+
+    import numpy as np
+
+    from core.comparator import _hamming_pairs
+
+    def search():
+        mat = np.random.default_rng(0).integers(0, 2**63, size=(64, 4), dtype=np.uint64)
+        assert len(_hamming_pairs(mat, mat, 10, 256)) >= 64
+
+    worker = threading.Thread(target=search)
+    worker.start()
+    worker.join()
+    """
+)
+
+# SearchThread submits the warm-up to its scan executor; the search may never reach the
+# Hamming stage afterwards
+_WARM_UP_SCRIPT = textwrap.dedent(
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.comparator import warm_up_hamming
+
+    with ThreadPoolExecutor(max_workers=3) as exe:
+        exe.submit(warm_up_hamming).result()
+    """
+)
+
+
+def _run(script: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_process_exits_after_hamming_on_worker_thread():
+    result = _run(_SEARCH_SCRIPT)
+    assert result.returncode == 0, result.stderr
+
+
+def test_process_exits_after_warm_up_on_executor_thread():
+    result = _run(_WARM_UP_SCRIPT)
+    assert result.returncode == 0, result.stderr
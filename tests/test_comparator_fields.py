@@ -0,0 +1,44 @@
+"""
+Metadata (non-hash) matching on the selected compare fields.
+"""
+
+from core.comparator import find_matches
+from core.image_scanner import ImageFileObj
+
+
+def _file(path: str, size: int = 1000, dimensions=(640, 480)) -> ImageFileObj:
+    return ImageFileObj(path=path, name=path.rsplit("/", 1)[-1], size=size, dimensions=dimensions)
+
+
+def test_unset_exif_fields_do_not_block_matches():
+    ref = [_file("/ref/a.jpg")]
+    work = [_file("/work/b.jpg"), _file("/work/c.jpg", size=2000)]
+
+    matches, uniques_ref, uniques_work = find_matches(
+        ref, work, {"hash": False, "fields": ["size", "dimensions", "make", "model"]}
+    )
+
+    assert [(r.path, w.path, reasons) for r, w, reasons in matches] == [
+        ("/ref/a.jpg", "/work/b.jpg", ["size", "dimensions"])
+    ]
+    assert uniques_ref == []
+    assert [w.path for w in uniques_work] == ["/work/c.jpg"]
+
+
+def test_only_unset_exif_fields_falls_back_to_basename():
+    ref = [_file("/ref/a.jpg")]
+    work = [_file("/work/a.jpg", size=2000), _file("/work/b.jpg")]
+
+    matches, _, _ = find_matches(ref, work, {"hash": False, "fields": ["artist"]})
+
+    assert [(r.path, w.path, reasons) for r, w, reasons in matches] == [("/ref/a.jpg", "/work/a.jpg", ["name"])]
+
+
+def test_unknown_scanned_field_never_matches():
+    ref = [_file("/ref/a.jpg", dimensions=None)]
+    work = [_file("/work/b.jpg", dimensions=None)]
+
+    matches, uniques_ref, uniques_work = find_matches(ref, work, {"hash": False, "fields": ["size", "dimensions"]})
+
+    assert matches == []
+    assert len(uniques_ref) == 1 and len(uniques_work) == 1
@@ -0,0 +1,49 @@
+"""
+Draft-mode hashes of camera-sized JPEGs must stay within DRAFT_MAX_DRIFT_BITS of imagehash.dhash
+on the full-resolution image.
+"""
+
+import imagehash
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.fast_hash import DRAFT_MAX_DRIFT_BITS, dhash_batch, dhash_pixels
+
+SIZE = (4000, 3000)
+
+
+def _textured(rng: np.random.Generator) -> np.ndarray:
+    # coarse structure plus per-pixel noise, like a detailed photo
+    base = Image.fromarray(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)).resize(SIZE, Image.BICUBIC)
+    noise = rng.integers(-24, 25, (SIZE[1], SIZE[0], 1), dtype=np.int16)
+    return np.clip(np.asarray(base, dtype=np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def _flat(rng: np.random.Generator) -> np.ndarray:
+    # a sky that only darkens towards the horizon above a noisy foreground: horizontal
+    # neighbours in the upper grid are near-equal
+    width, height = SIZE
+    rows = 150 + np.linspace(0, 8, height)[:, None] + rng.normal(0, 3, (height, 1))
+    sky = np.repeat(rows, width, axis=1)[:, :, None] * np.array([0.8, 0.9, 1.1])
+    horizon = height * 3 // 4
+    sky[horizon:] = rng.integers(40, 140, (height - horizon, width, 3))
+    return np.clip(sky, 0, 255).astype(np.uint8)
+
+
+def _dhash_bits(path, hash_size: int) -> np.ndarray:
+    with Image.open(path) as im:
+        return np.asarray(imagehash.dhash(im, hash_size=hash_size).hash, dtype=bool).ravel()
+
+
+@pytest.mark.parametrize("make", [_textured, _flat])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_draft_hash_drift_is_bounded(tmp_path, make, seed):
+    path = tmp_path / "photo.jpg"
+    Image.fromarray(make(np.random.default_rng(seed))).save(path, quality=90)
+
+    for hash_size in (8, 16):
+        row = dhash_batch(dhash_pixels(str(path), hash_size)[None])[0]
+        bits = np.unpackbits(row.astype(">u8").view(np.uint8))[-hash_size * hash_size:].astype(bool)
+        drift = int(np.count_nonzero(bits != _dhash_bits(path, hash_size)))
+        assert drift <= DRAFT_MAX_DRIFT_BITS, (make.__name__, hash_size, drift)
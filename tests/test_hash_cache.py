@@ -0,0 +1,95 @@
+"""
+Cached hash rows are reused only while the file's size and mtime_ns, the hash size and
+fast_hash.HASH_TYPE are unchanged.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core import hash_cache, hash_utils
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Paths decoded by _compute_packed_hashes (i.e. not served from the cache)."""
+    seen = []
+    dhash_pixels = hash_utils.dhash_pixels
+
+    def spy(path, hash_size):
+        seen.append(path)
+        return dhash_pixels(path, hash_size)
+
+    monkeypatch.setattr(hash_utils, "dhash_pixels", spy)
+    return seen
+
+
+def _write(path, seed: int, size=(64, 48)):
+    pixels = np.random.default_rng(seed).integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path)
+
+
+def _hash(path, cache_path, hash_size=8):
+    (row,) = hash_utils._compute_packed_hashes([str(path)], hash_size, str(cache_path)).values()
+    return row
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path, decodes):
+    image, db = tmp_path / "a.png", tmp_path / "cache.db"
+    _write(image, 0)
+
+    first = _hash(image, db)
+    second = _hash(image, db)
+
+    assert decodes == [str(image)]
+    assert np.array_equal(first, second)
+
+
+def test_rewritten_file_is_recomputed(tmp_path, decodes):
+    image, db = tmp_path / "a.png", tmp_path / "cache.db"
+    _write(image, 0)
+    first = _hash(image, db)
+
+    _write(image, 1, size=(80, 60))
+    second = _hash(image, db)
+
+    assert len(decodes) == 2
+    assert not np.array_equal(first, second)
+    assert np.array_equal(second, _hash(image, tmp_path / "fresh.db"))
+
+
+def test_touched_file_is_recomputed(tmp_path, decodes):
+    image, db = tmp_path / "a.png", tmp_path / "cache.db"
+    _write(image, 0)
+    _hash(image, db)
+
+    st = os.stat(image)
+    os.utime(image, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _hash(image, db)
+
+    assert len(decodes) == 2
+
+
+def test_other_hash_size_is_recomputed(tmp_path, decodes):
+    image, db = tmp_path / "a.png", tmp_path / "cache.db"
+    _write(image, 0)
+    _hash(image, db, hash_size=8)
+
+    row = _hash(image, db, hash_size=16)
+
+    assert len(decodes) == 2
+    assert row.shape == (4,)
+
+
+def test_other_hash_type_is_recomputed(tmp_path, decodes, monkeypatch):
+    image, db = tmp_path / "a.png", tmp_path / "cache.db"
+    _write(image, 0)
+    _hash(image, db)
+
+    monkeypatch.setattr(hash_cache, "HASH_TYPE", hash_cache.HASH_TYPE + "-changed")
+    _hash(image, db)
+    _hash(image, db)
+
+    assert len(decodes) == 2
@@ -0,0 +1,24 @@
+"""
+Scanned dimensions follow the EXIF Orientation tag whether or not EXIF handling was requested.
+"""
+
+import pytest
+from PIL import Image
+
+from core.image_scanner import scan_images_in_directory
+
+# Orientation 6: the stored image must be rotated 90 degrees to display upright
+_ROTATE_90 = 6
+
+
+@pytest.mark.parametrize("need_exif", [False, True])
+@pytest.mark.parametrize("fmt", ["JPEG", "PNG", "WEBP", "TIFF"])
+def test_dimensions_are_upright(tmp_path, fmt, need_exif):
+    exif = Image.Exif()
+    exif[0x0112] = _ROTATE_90
+    Image.new("RGB", (60, 40)).save(tmp_path / f"rotated.{fmt.lower()}", fmt, exif=exif)
+    Image.new("RGB", (60, 40)).save(tmp_path / f"plain.{fmt.lower()}", fmt)
+
+    dims = {f.name.split(".")[0]: f.dimensions for f in scan_images_in_directory(str(tmp_path), need_exif)}
+
+    assert dims == {"rotated": (40, 60), "plain": (60, 40)}
@@ -0,0 +1,95 @@
+"""
+cached_scan reuses a stored scan while the tree's fingerprint is unchanged and rescans
+after files are added, removed or replaced.
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core import scan_cache
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Roots actually scanned (cache misses); the in-memory cache starts empty."""
+    monkeypatch.setattr(scan_cache, "_memory_cache", OrderedDict())
+    seen = []
+    scan = scan_cache.scan_images_in_directory
+
+    def spy(root, *args, **kwargs):
+        seen.append(root)
+        return scan(root, *args, **kwargs)
+
+    monkeypatch.setattr(scan_cache, "scan_images_in_directory", spy)
+    return seen
+
+
+def _write(path, size=(64, 48)):
+    pixels = np.random.default_rng(len(str(path))).integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path)
+
+
+def _scan(root, db):
+    return {f.name: f.dimensions for f in scan_cache.cached_scan(str(root), str(db), need_exif=False)}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "photos"
+    (root / "sub").mkdir(parents=True)
+    _write(root / "a.png")
+    _write(root / "sub" / "b.png")
+    return root, tmp_path / "cache.db"
+
+
+def test_unchanged_tree_is_a_hit(tree, scans):
+    root, db = tree
+    first = _scan(root, db)
+    assert _scan(root, db) == first  # in-memory hit
+    scan_cache._memory_cache.clear()
+    assert _scan(root, db) == first  # on-disk hit
+
+    assert scans == [str(root)]
+    assert first == {"a.png": (64, 48), "b.png": (64, 48)}
+
+
+def test_added_file_is_a_miss(tree, scans):
+    root, db = tree
+    _scan(root, db)
+
+    _write(root / "sub" / "c.png")
+
+    assert set(_scan(root, db)) == {"a.png", "b.png", "c.png"}
+    assert len(scans) == 2
+
+
+def test_removed_file_is_a_miss(tree, scans):
+    root, db = tree
+    _scan(root, db)
+
+    os.remove(root / "sub" / "b.png")
+
+    assert set(_scan(root, db)) == {"a.png"}
+    assert len(scans) == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="st_ctime is the creation time on Windows")
+def test_file_replaced_with_older_mtime_is_a_miss(tree, scans):
+    root, db = tree
+    # BMPs of one size have one byte size, so neither the count nor the total size changes
+    target = root / "old.bmp"
+    Image.new("RGB", (32, 32), "red").save(target)
+    os.utime(target, (1_000_000_000, 1_000_000_000))
+    _scan(root, db)
+    time.sleep(0.05)  # file timestamps advance in coarse (jiffy) steps
+
+    Image.new("RGB", (32, 32), "blue").save(target)
+    os.utime(target, (1_000_000_000, 1_000_000_000))
+    _scan(root, db)
+
+    assert len(scans) == 2
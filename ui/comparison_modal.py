@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpacerItem, QSizePolicy,
     QMessageBox, QTableWidget, QTableWidgetItem
 )
-from PySide6.QtGui import QPixmap, QColor
+from PySide6.QtGui import QPixmap, QColor, QImageReader
 from PySide6.QtCore import Qt
 import os
 from datetime import datetime
@@ -13,6 +13,18 @@ def _human_ts(ts):
     except Exception:
         return str(ts)
 
+def _load_preview(path, side):
+    """Decode path straight at preview size (JPEG IDCT scaling) instead of full resolution."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(side, side, Qt.KeepAspectRatio))
+    img = reader.read()
+    if not img.isNull() and (img.width() > side or img.height() > side):
+        img = img.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return QPixmap.fromImage(img)
+
 class ComparisonModal(QDialog):
     """
     Comparison modal shows the two images side-by-side and displays extended metadata
@@ -32,14 +44,12 @@ class ComparisonModal(QDialog):
         imgs_layout = QHBoxLayout()
         # Left image (reference)
         img1_label = QLabel()
-        if os.path.exists(image1_path):
-            pix1 = QPixmap(image1_path)
-            if not pix1.isNull():
-                img1_label.setPixmap(pix1.scaled(420, 420, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                img1_label.setText("Unable to load image")
+        pix1 = _load_preview(image1_path, 420)
+        if not pix1.isNull():
+            img1_label.setPixmap(pix1)
         else:
-            img1_label.setText("Missing")
+            # only stat on the failure path to tell a missing file from an unreadable one
+            img1_label.setText("Unable to load image" if os.path.exists(image1_path) else "Missing")
 
         imgs_layout.addWidget(img1_label)
 
@@ -47,14 +57,12 @@ class ComparisonModal(QDialog):
 
         # Right image (working)
         img2_label = QLabel()
-        if os.path.exists(image2_path):
-            pix2 = QPixmap(image2_path)
-            if not pix2.isNull():
-                img2_label.setPixmap(pix2.scaled(420, 420, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                img2_label.setText("Unable to load image")
+        pix2 = _load_preview(image2_path, 420)
+        if not pix2.isNull():
+            img2_label.setPixmap(pix2)
         else:
-            img2_label.setText("Missing")
+            # only stat on the failure path to tell a missing file from an unreadable one
+            img2_label.setText("Unable to load image" if os.path.exists(image2_path) else "Missing")
 
         imgs_layout.addWidget(img2_label)
         layout.addLayout(imgs_layout)
@@ -86,8 +94,12 @@ class ComparisonModal(QDialog):
         table.setSelectionMode(QTableWidget.NoSelection)
 
         for row, (label, key) in enumerate(keys):
-            left_val = meta1.get(key, "")
-            right_val = meta2.get(key, "")
+            left_val = meta1.get(key)
+            right_val = meta2.get(key)
+            if left_val is None:
+                left_val = ""
+            if right_val is None:
+                right_val = ""
 
             # Format some fields for readability
             if key in ("created", "mtime") and left_val:
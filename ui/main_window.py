@@ -4,34 +4,81 @@
 #
 # This file depends on ui/styles.py for GLASSY_STYLE / DARK_STYLE.
 
+import errno
 import os
 import shutil
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 import logging
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
     QFileDialog, QCheckBox, QProgressBar, QScrollArea,
     QSizePolicy, QFrame, QMessageBox, QToolButton, QMenu, QSlider,
-    QTabWidget, QApplication, QStyle, QTreeView, QFileSystemModel
+    QTabWidget, QApplication, QStyle, QTreeView, QFileSystemModel, QButtonGroup
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal,QThread, QSettings, QDir, QModelIndex
+from PySide6.QtCore import Qt, Signal,QThread, QSettings, QDir, QModelIndex, QTimer, QObject, QRunnable, QThreadPool, QPoint
 
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtGui import QPixmap, QIcon, QImage, QImageReader, QFont
+import shiboken6
 # from PyQt5 import sip
-from core.image_scanner import scan_images_in_directory, ImageFileObj
-from core.comparator import find_duplicates, find_uniques, find_matches
-from .styles import GLASSY_STYLE, DARK_STYLE
+# core (numpy, PIL, imagehash, numba) and send2trash are imported where they are used,
+# on worker threads, so none of them delays the first window
+if TYPE_CHECKING:
+    from core.image_scanner import ImageFileObj
+from .styles import GLASSY_STYLE, DARK_STYLE, FONT_FAMILIES, FONT_SIZE_PX
 from .comparison_modal import ComparisonModal
 from .hash_info_dialog import HashInfoDialog
-from send2trash import send2trash
 # from core.cache_db import CacheDB
 # from core.indexer import Indexer
 # from .cached_dirs_modal import CachedDirsModal
 logger = logging.getLogger(__name__)
 
+# Thumbnails at or below this side length are scaled without smoothing
+THUMB_FAST_MAX = 150
+
+# Memory budget for decoded thumbnail pixmaps kept across result refreshes
+THUMB_CACHE_BYTES = 64 * 1024 * 1024
+
+# (error title, error text, success text) shown when a bulk file operation finishes;
+# operations without an entry finish silently
+_FILE_OP_MESSAGES = {
+    "delete_duplicates": ("Delete errors", "Some files could not be moved to Trash:", "All duplicate working files moved to Trash."),
+    "delete_selected": ("Delete errors", "Some files could not be moved to trash:", "Selected files moved to Trash."),
+    "move_selected": ("Move errors", "Some files could not be moved:", "Selected files moved."),
+    "save_uniques": ("Copy errors", "Some files failed to copy:", "Unique files copied."),
+}
+
+# File operations that leave the source files in place (their result rows stay)
+_COPY_FILE_OPS = {"save_uniques"}
+
+# Result rows are materialized in pages of this size ("Show next" loads more)
+RESULTS_PAGE_SIZE = 200
+
+# Rows built per event loop tick while a page fills
+RENDER_CHUNK_SIZE = 50
+
+# Detached result rows of each kind kept for reuse by the next page or search
+ROW_POOL_MAX = 2 * RESULTS_PAGE_SIZE
+
+# _last_results key -> attribute prefix of the tab's container/layout/scroll
+_RESULT_TABS = {
+    "duplicates": "duplicates",
+    "unique_in_ref": "uniques_ref",
+    "unique_in_work": "uniques_work",
+}
+
+# _last_results key -> (tab index, tab title before the count)
+_RESULT_TAB_TITLES = {
+    "duplicates": (0, "Duplicates"),
+    "unique_in_ref": (1, "Uniques (Ref)"),
+    "unique_in_work": (2, "Uniques (Work)"),
+}
+
 
 class DropLineEdit(QLineEdit):
     """QLineEdit that accepts a dropped folder path."""
@@ -101,43 +148,268 @@ def make_button(text: str = "", icon: QIcon = None, object_name: str = "", style
 
 
 class SearchThread(QThread):
-    """Background thread: scans folders and runs comparator."""
-    results_ready = Signal(object)
+    """Background thread: scans folders and runs comparator.
+
+    Results are emitted in two steps so the Duplicates tab can be populated before
+    the Uniques tabs: duplicates_ready carries the matches (plus scan inputs), then
+    uniques_ready carries the per-side unique lists.
+    """
+    duplicates_ready = Signal(object)
+    uniques_ready = Signal(object)
     progress = Signal(int)
 
-    def __init__(self, ref_dir: str, work_dir: str, criteria: dict):
+    def __init__(self, ref_dir: str, work_dir: str, criteria: dict, cache_path: Optional[str] = None):
         super().__init__()
         self.ref_dir = ref_dir
         self.work_dir = work_dir
         self.criteria = criteria
+        # on-disk scan and hash cache; None uses scan_cache.DEFAULT_CACHE_PATH, "" disables it
+        self.cache_path = cache_path
 
     def run(self):
+        from core.comparator import find_matches, warm_up_hamming
+        from core.image_scanner import EXIF_DEPENDENT_FIELDS
+        from core.scan_cache import DEFAULT_CACHE_PATH, cached_scan
+
+        cache_path = DEFAULT_CACHE_PATH if self.cache_path is None else self.cache_path
         logger.debug("SearchThread: scanning ref=%s work=%s criteria=%s", self.ref_dir, self.work_dir, self.criteria)
         self.progress.emit(5)
-        ref_files = scan_images_in_directory(self.ref_dir) if self.ref_dir else []
-        self.progress.emit(40)
-        work_files = scan_images_in_directory(self.work_dir) if self.work_dir else []
+        # the hash comparison never looks at metadata, so EXIF handling can be skipped
+        fields = self.criteria.get("fields") or []
+        need_exif = not self.criteria.get("hash") and any(k in fields for k in EXIF_DEPENDENT_FIELDS)
+        # Scanning is I/O bound, so scan both folders concurrently on threads
+        scans = {"ref": [], "work": []}
+        dirs = [(side, d) for side, d in (("ref", self.ref_dir), ("work", self.work_dir)) if d]
+        if len(dirs) == 2 and os.path.normcase(os.path.abspath(dirs[0][1])) == os.path.normcase(os.path.abspath(dirs[1][1])):
+            # same folder on both sides: scan it once
+            dirs = dirs[:1]
+        # per-side fraction of files scanned, averaged into one smooth 5-70% progress range;
+        # a side counts as 0 until its walk has found how many files it has
+        fractions = {side: 0.0 for side, _ in dirs}
+        fractions_lock = threading.Lock()
+        last_pct = [5]
+
+        def _scan_progress(side):
+            def report(done, total):
+                with fractions_lock:
+                    fractions[side] = done / total if total else 1.0
+                    pct = 5 + int(65 * sum(fractions.values()) / len(fractions))
+                    if pct <= last_pct[0]:
+                        return
+                    last_pct[0] = pct
+                self.progress.emit(pct)
+            return report
+
+        with ThreadPoolExecutor(max_workers=3) as exe:
+            if self.criteria.get("hash"):
+                # JIT-compile the Hamming kernel while the disks are busy
+                exe.submit(warm_up_hamming)
+            future_to_side = {
+                exe.submit(cached_scan, d, cache_path, need_exif, _scan_progress(side)): side
+                for side, d in dirs
+            }
+            for fut in as_completed(future_to_side):
+                side = future_to_side[fut]
+                try:
+                    scans[side] = fut.result()
+                except Exception:
+                    logger.exception("Scanning %s directory failed", side)
+        if len(dirs) == 1 and self.ref_dir and self.work_dir:
+            scans["work"] = scans["ref"]
+        ref_files = scans["ref"]
+        work_files = scans["work"]
         self.progress.emit(70)
 
         duplicates = []
-        uniques = ([], [])
+        unique_ref, unique_work = [], []
         try:
-            duplicates, unique_ref,unique_work = find_matches(ref_files, work_files, self.criteria)
+            duplicates, unique_ref, unique_work = find_matches(ref_files, work_files, self.criteria, cache_path)
         except Exception:
-            logger.exception("find_duplicates failed")
+            logger.exception("find_matches failed")
 
-        self.progress.emit(95)
-        self.results_ready.emit({
+        self.progress.emit(90)
+        self.duplicates_ready.emit({
             "duplicates": duplicates,
-            "unique_in_ref": unique_ref,
-            "unique_in_work": unique_work,
             "ref_files": ref_files,
             "work_files": work_files,
             "criteria": self.criteria
         })
+        self.progress.emit(95)
+        self.uniques_ready.emit({
+            "unique_in_ref": unique_ref,
+            "unique_in_work": unique_work,
+        })
         self.progress.emit(100)
 
 
+class ThumbSignals(QObject):
+    """Signals for ThumbTask (QRunnable is not a QObject and cannot own signals)."""
+    ready = Signal(str, int, QImage)
+
+
+class ThumbTask(QRunnable):
+    """Pool task: decode and scale one thumbnail as a QImage off the GUI thread.
+
+    QPixmap may only be touched on the GUI thread, so the task emits the scaled
+    QImage and the receiving slot wraps it with QPixmap.fromImage.
+    """
+    def __init__(self, path: str, side: int, signals: ThumbSignals):
+        super().__init__()
+        self.path = path
+        self.side = side
+        self.signals = signals
+
+    def run(self):
+        side = self.side
+        reader = QImageReader(self.path)
+        # honour EXIF orientation like the scanner's exif_transpose
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            # Let the decoder downscale (libjpeg IDCT scaling) instead of decoding full size
+            reader.setScaledSize(size.scaled(side, side, Qt.KeepAspectRatio))
+        img = reader.read()
+        if not img.isNull() and (img.width() > side or img.height() > side):
+            # bilinear filtering is not visible at small thumbnail sizes
+            mode = Qt.FastTransformation if side <= THUMB_FAST_MAX else Qt.SmoothTransformation
+            img = img.scaled(side, side, Qt.KeepAspectRatio, mode)
+        self.signals.ready.emit(self.path, side, img)
+
+
+def _trash_paths(paths: List[str]):
+    """Move paths to the Trash; returns (done, errors). Missing files count as done."""
+    from send2trash import send2trash
+
+    paths = list(paths)
+    try:
+        # one batched call (a single IFileOperation / gio session) for the whole list
+        send2trash(paths)
+        return paths, []
+    except Exception:
+        pass
+    # the batch failed somewhere: retry one by one to find out which files
+    done, errors = [], []
+    for p in paths:
+        try:
+            send2trash(p)
+            done.append(p)
+        except FileNotFoundError:
+            done.append(p)
+        except Exception as e:
+            errors.append((p, str(e)))
+    return done, errors
+
+
+def _move_one(src: str, dst: str):
+    """
+    Rename src to dst in place when both are on one filesystem, else copy and unlink.
+    Never overwrites: raises FileExistsError when dst is already taken.
+    """
+    if os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, "Destination already exists", dst)
+    try:
+        # os.rename (unlike os.replace) also refuses an existing target on Windows
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _unique_target(folder: Path, name: str, claimed: set) -> Path:
+    """
+    Return folder/name, or folder/stem_N.suffix when that name is already on disk or
+    claimed by an earlier file of the same batch; records the chosen name in claimed.
+    """
+    target = folder / name
+    stem, suffix = os.path.splitext(name)
+    counter = 1
+    while target.name in claimed or target.exists():
+        target = folder / f"{stem}_{counter}{suffix}"
+        counter += 1
+    claimed.add(target.name)
+    return target
+
+
+def _plan_moves(paths: List[str], dest: str) -> List[tuple]:
+    """
+    Pair each path with a distinct target in dest, serially, so the parallel moves never
+    race onto one name (duplicates often share a basename).
+    """
+    folder = Path(os.path.abspath(dest))
+    claimed = set()
+    return [(p, str(_unique_target(folder, os.path.basename(p), claimed))) for p in paths]
+
+
+def _move_paths(plan: List[tuple]):
+    """Run (src, dst) moves from _plan_moves in parallel; returns (done, errors). Missing files are skipped."""
+    done, errors = [], []
+    with ThreadPoolExecutor(max_workers=8) as exe:
+        future_to_path = {exe.submit(_move_one, src, dst): src for src, dst in plan}
+        for fut in as_completed(future_to_path):
+            p = future_to_path[fut]
+            try:
+                fut.result()
+                done.append(p)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                errors.append((p, str(e)))
+    return done, errors
+
+
+def _copy_one(src: str, dst: str):
+    """
+    Copy src to dst with its metadata, like shutil.copy2, but never overwrite:
+    raises FileExistsError when dst is already taken.
+    """
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _copy_paths(plan: List[tuple]):
+    """Run (src, dst) copies in parallel; returns (done, errors)."""
+    done, errors = [], []
+    # copies are I/O bound (file reads and writes release the GIL), so threads suffice
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as exe:
+        future_to_path = {exe.submit(_copy_one, src, dst): src for src, dst in plan}
+        for fut in as_completed(future_to_path):
+            p = future_to_path[fut]
+            try:
+                fut.result()
+                done.append(p)
+            except FileNotFoundError:
+                errors.append((p, "Missing"))
+            except Exception as e:
+                errors.append((p, str(e)))
+    return done, errors
+
+
+class FileOpSignals(QObject):
+    """Signals for FileOpTask: (operation name, paths done, [(path, error)])."""
+    finished = Signal(str, list, list)
+
+
+class FileOpTask(QRunnable):
+    """Pool task: run a bulk trash/move/copy helper off the GUI thread and report back."""
+    def __init__(self, op: str, func, args, signals: FileOpSignals):
+        super().__init__()
+        self.op = op
+        self.func = func
+        self.args = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            done, errors = self.func(*self.args)
+        except Exception as e:
+            logger.exception("File operation %s failed", self.op)
+            done, errors = [], [("", str(e))]
+        self.signals.finished.emit(self.op, done, errors)
+
+
 class MainWindow(QWidget):
     SETTINGS_ORG = "unique-image-finder"
     SETTINGS_APP = "uifinder"
@@ -147,6 +419,7 @@ class MainWindow(QWidget):
         self.setMinimumWidth(1100)
         self._settings = QSettings(self.SETTINGS_ORG, self.SETTINGS_APP)
         theme = self._settings.value("theme", "light")
+        self._apply_font()
         self._apply_theme(theme)
         # self._cache_db = CacheDB()
         # self._indexer = Indexer(self._cache_db)
@@ -154,60 +427,176 @@ class MainWindow(QWidget):
         # internal state
         self._thread = None
         self._last_results = None
-        self._selected_paths = set()
+        # dict used as an insertion-ordered set: files are moved/deleted in selection order
+        self._selected_paths = {}
+        self._count_update_pending = False
+        # paging state for the result tabs: rows rendered so far and "Show next" buttons
+        self._rendered_counts = dict.fromkeys(_RESULT_TABS, 0)
+        self._more_buttons = {}
+        # rows the page being built should reach; chunks check the generation to stop after a clear
+        self._render_targets = dict.fromkeys(_RESULT_TABS, 0)
+        self._render_generation = 0
+        # row checkbox selection model: per-tab QButtonGroup, checkbox id -> path
+        self._check_groups = {}
+        self._check_paths = {}
+        self._next_check_id = 0
+        # last checkbox id clicked per group, the anchor for shift-click range selection
+        self._check_anchor = {}
         self._last_tree_index = None
+        # memoized search form state, reset by the field/hash/similarity change signals
+        self._fields_cache: Optional[tuple] = None
+        # number of checked compare-field actions, kept by _on_field_toggled
+        self._checked_field_count = 0
+        # directory picker shared by browse/save/move, see _dir_dialog_for
+        self._dir_dialog: Optional[QFileDialog] = None
+        self._criteria_cache: Optional[dict] = None
+        # shared fallback thumbnail for files Qt cannot decode
+        self._placeholder_pix = QPixmap(100, 100)
+        self._placeholder_pix.fill(Qt.gray)
+        # background thumbnail decoding: (path, side) -> labels waiting for that image
+        self._pending_thumbs = {}
+        # thumbnails waiting to scroll into view: tab key -> [(label, path, side)]
+        self._lazy_thumbs = {}
+        # rendered result rows by image path (row -> None, an ordered set), so removals
+        # don't have to scan the tabs
+        self._row_index = defaultdict(dict)
+        # detached result rows ready for reuse, by kind ("duplicate" / "unique")
+        self._row_pool = {"duplicate": [], "unique": []}
+        # scaled thumbnails, least recently used first: (path, side) -> QPixmap
+        self._thumb_cache = OrderedDict()
+        self._thumb_cache_bytes = 0
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_signals = ThumbSignals(self)
+        self._thumb_signals.ready.connect(self._on_thumb_ready)
+        # bulk trash/move runs here, one operation at a time
+        self._file_pool = QThreadPool(self)
+        self._file_pool.setMaxThreadCount(1)
+        self._file_op_signals = FileOpSignals(self)
+        self._file_op_signals.finished.connect(self._on_file_op_finished)
 
         self._build_ui()
         self._restore_settings()
 
     # ---------- styling ----------
+    def _apply_font(self):
+        # The font is the same in both themes, so it is set once on the application
+        # instead of in the stylesheet that every theme change re-applies
+        font = QFont()
+        font.setFamilies(FONT_FAMILIES)
+        font.setStyleHint(QFont.Monospace)
+        font.setPixelSize(FONT_SIZE_PX)
+        app = QApplication.instance()
+        (app if app is not None else self).setFont(font)
+
     def _apply_theme(self, theme_name: str):
-        if theme_name == "dark":
-            self.setStyleSheet(DARK_STYLE)
-        else:
-            self.setStyleSheet(GLASSY_STYLE)
+        style = DARK_STYLE if theme_name == "dark" else GLASSY_STYLE
+        # Qt re-parses and re-polishes every widget on setStyleSheet, so skip no-op changes
+        if style is getattr(self, "_applied_style", None):
+            return
+        self._applied_style = style
+        # Set once on the application: dialogs and message boxes inherit it without a
+        # stylesheet of their own
+        app = QApplication.instance()
+        (app if app is not None else self).setStyleSheet(style)
+
+
+    # ---------- row selection (one QButtonGroup per tab) ----------
+    def _check_group(self, key: str) -> QButtonGroup:
+        """
+        Return the tab's non-exclusive QButtonGroup, creating it on first use.
+
+        The group is the tab's selection model: every row checkbox is registered with a
+        numeric id that maps back to its path in self._check_paths, and one idToggled
+        connection per tab replaces per-checkbox signal connections.
+        """
+        group = self._check_groups.get(key)
+        if group is None:
+            group = QButtonGroup(self)
+            group.setExclusive(False)
+            group.idToggled.connect(self._on_check_toggled)
+            self._check_groups[key] = group
+        return group
+
+    def _add_row_checkbox(self, key: str, path: str, cb: Optional[QCheckBox] = None) -> QCheckBox:
+        """Register cb (a new checkbox if None) as the tab's selection checkbox for path."""
+        if cb is None:
+            cb = QCheckBox()
+        check_id = self._next_check_id
+        self._next_check_id += 1
+        self._check_paths[check_id] = path
+        cb.setProperty("check_id", check_id)
+        # rows rendered later ("Show next", re-render) reflect the current selection
+        cb.setChecked(path in self._selected_paths)
+        self._check_group(key).addButton(cb, check_id)
+        return cb
+
+    def _on_check_toggled(self, check_id: int, checked: bool):
+        group = self.sender()
+        anchor = self._check_anchor.get(group)
+        self._check_anchor[group] = check_id
+        if anchor is not None and anchor != check_id and QApplication.keyboardModifiers() & Qt.ShiftModifier:
+            # shift-click: apply this state to every row between the anchor and this one;
+            # ids grow in render order, so the id range is the visual range
+            lo, hi = sorted((anchor, check_id))
+            # the group re-emits idToggled for every row set here; block it so this slot
+            # does not re-enter per row (and move the anchor)
+            group.blockSignals(True)
+            try:
+                for checkbox in group.buttons():
+                    cid = group.id(checkbox)
+                    if lo <= cid <= hi:
+                        self._set_row_checked(checkbox, self._check_paths.get(cid), checked)
+            finally:
+                group.blockSignals(False)
+            self._update_selected_count()
+            return
+        path = self._check_paths.get(check_id)
+        if path:
+            self._toggle_selection(path, checked)
 
+    def _set_row_checked(self, checkbox: QCheckBox, path: Optional[str], checked: bool):
+        """
+        Set one row's checkbox and selection state. Bulk callers block the row's
+        QButtonGroup around their loop: its idToggled is emitted by the group itself,
+        so blocking the checkbox's signals would not stop it.
+        """
+        if path:
+            if checked:
+                self._selected_paths[path] = None
+            else:
+                self._selected_paths.pop(path, None)
+        checkbox.setChecked(checked)
 
-    # ---------- layout helpers for tab select all ----------
-    def _toggle_all_in_layout(self, state, layout):
+    def _toggle_all_in_tab(self, state, key: str):
         """
-        Toggle the state of all checkboxes in the given layout based on the 'Select All' checkbox,
+        Toggle every row checkbox of one result tab to match its 'Select All' checkbox,
         and update the application state (_selected_paths) accordingly.
 
         Args:
             state (int): The state of the 'Select All' checkbox (0 = unchecked, 2 = checked).
-            layout (QVBoxLayout): The layout containing the dynamically added rows with checkboxes.
+            key (str): The _last_results key of the tab ("duplicates", "unique_in_ref", "unique_in_work").
         """
         select_all = state > 0  # True if the 'Select All' checkbox is checked, False otherwise
-
-        # Iterate over all the widgets in the layout (rows of duplicates or uniques)
-        for i in range(layout.count()):
-            item = layout.itemAt(i)  # Get the layout item
-            if item is not None:
-                row_widget = item.widget()  # This is the QFrame or row container
-                if row_widget is not None:
-                    # Check for any QCheckBox inside the row widget
-                    checkboxes = row_widget.findChildren(QCheckBox)
-                    for checkbox in checkboxes:
-                        # Avoid altering the "Select All" checkbox itself
-                        if checkbox != layout.itemAt(0).widget():
-                            path = checkbox.property("path")  # Assume `path` is stored in the checkbox
-                            if select_all and path:
-                                # Add the path to the selection state
-                                self._selected_paths.add(path)
-                            elif not select_all and path:
-                                # Remove the path from the selection state
-                                self._selected_paths.discard(path)
-
-                            checkbox.blockSignals(True)  # Prevent triggering signals while toggling
-                            checkbox.setChecked(select_all)  # Set the checkbox state
-                            checkbox.blockSignals(False)
+        # every result of the tab, including pages that are not rendered yet; rows rendered
+        # later pick their state up from _selected_paths
+        paths = self._result_paths(key, (self._last_results or {}).get(key, []))
+        if select_all:
+            self._selected_paths.update(dict.fromkeys(paths))
+        else:
+            for path in paths:
+                self._selected_paths.pop(path, None)
+        group = self._check_groups.get(key)
+        if group is not None:
+            group.blockSignals(True)
+            try:
+                for checkbox in group.buttons():
+                    self._set_row_checked(checkbox, self._check_paths.get(group.id(checkbox)), select_all)
+            finally:
+                group.blockSignals(False)
 
         # Update the UI footer or other relevant state display
         self._update_selected_count()
 
-
-
     # ---------- UI construction ----------
     def _build_ui(self):
         main_layout = QHBoxLayout(self)
@@ -343,6 +732,8 @@ class MainWindow(QWidget):
         self.sim_slider.setFixedWidth(180)
         self.sim_lbl = QLabel(f"{self.sim_slider.value()}%")
         self.sim_slider.valueChanged.connect(lambda v: self.sim_lbl.setText(f"{v}%"))
+        self.sim_slider.valueChanged.connect(self._invalidate_criteria_cache)
+        self.hash_cb.toggled.connect(self._invalidate_criteria_cache)
 
         self.search_btn = make_button("Search", object_name="search_btn", style_class="search")
         self.search_btn.clicked.connect(self.on_search_clicked)
@@ -373,54 +764,54 @@ class MainWindow(QWidget):
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Duplicates tab
-        self.duplicates_container = QWidget()
-        self.duplicates_layout = QVBoxLayout(self.duplicates_container)
+        self.duplicates_container, self.duplicates_layout = self._make_results_container()
 
         # Add 'Select All' checkbox for duplicates
         self.select_all_duplicates_checkbox = QCheckBox("Select All Duplicates")
         self.select_all_duplicates_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.duplicates_layout)
+            lambda state: self._toggle_all_in_tab(state, "duplicates")
         )
         self.duplicates_layout.addWidget(self.select_all_duplicates_checkbox)
 
-        self.duplicates_layout.setAlignment(Qt.AlignTop)
         self.duplicates_scroll = QScrollArea()
         self.duplicates_scroll.setWidgetResizable(True)
         self.duplicates_scroll.setWidget(self.duplicates_container)
+        self.duplicates_scroll.verticalScrollBar().valueChanged.connect(lambda _: self._load_visible_thumbs("duplicates"))
+        self.duplicates_scroll.verticalScrollBar().rangeChanged.connect(lambda *_: self._load_visible_thumbs("duplicates"))
         self.tabs.addTab(self.duplicates_scroll, "Duplicates (0)")
 
         # Uniques (Ref) tab
-        self.uniques_ref_container = QWidget()
-        self.uniques_ref_layout = QVBoxLayout(self.uniques_ref_container)
+        self.uniques_ref_container, self.uniques_ref_layout = self._make_results_container()
 
         # Add 'Select All' checkbox for uniques (Ref)
         self.select_all_uniques_ref_checkbox = QCheckBox("Select All Unique Reference Files")
         self.select_all_uniques_ref_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.uniques_ref_layout)
+            lambda state: self._toggle_all_in_tab(state, "unique_in_ref")
         )
         self.uniques_ref_layout.addWidget(self.select_all_uniques_ref_checkbox)
 
-        self.uniques_ref_layout.setAlignment(Qt.AlignTop)
         self.uniques_ref_scroll = QScrollArea()
         self.uniques_ref_scroll.setWidgetResizable(True)
         self.uniques_ref_scroll.setWidget(self.uniques_ref_container)
+        self.uniques_ref_scroll.verticalScrollBar().valueChanged.connect(lambda _: self._load_visible_thumbs("unique_in_ref"))
+        self.uniques_ref_scroll.verticalScrollBar().rangeChanged.connect(lambda *_: self._load_visible_thumbs("unique_in_ref"))
         self.tabs.addTab(self.uniques_ref_scroll, "Uniques (Ref) (0)")
 
         # Uniques (Work) tab
-        self.uniques_work_container = QWidget()
-        self.uniques_work_layout = QVBoxLayout(self.uniques_work_container)
+        self.uniques_work_container, self.uniques_work_layout = self._make_results_container()
 
         # Add 'Select All' checkbox for uniques (Work)
         self.select_all_uniques_work_checkbox = QCheckBox("Select All Unique Working Files")
         self.select_all_uniques_work_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.uniques_work_layout)
+            lambda state: self._toggle_all_in_tab(state, "unique_in_work")
         )
         self.uniques_work_layout.addWidget(self.select_all_uniques_work_checkbox)
 
-        self.uniques_work_layout.setAlignment(Qt.AlignTop)
         self.uniques_work_scroll = QScrollArea()
         self.uniques_work_scroll.setWidgetResizable(True)
         self.uniques_work_scroll.setWidget(self.uniques_work_container)
+        self.uniques_work_scroll.verticalScrollBar().valueChanged.connect(lambda _: self._load_visible_thumbs("unique_in_work"))
+        self.uniques_work_scroll.verticalScrollBar().rangeChanged.connect(lambda *_: self._load_visible_thumbs("unique_in_work"))
         self.tabs.addTab(self.uniques_work_scroll, "Uniques (Work) (0)")
 
         content_layout.addWidget(self.tabs, 1)
@@ -508,9 +899,20 @@ class MainWindow(QWidget):
         self._apply_theme(new)
         self._apply_theme_button_text()
 
+    def _dir_dialog_for(self, caption: str = "") -> QFileDialog:
+        """
+        Return the window's shared directory picker with its caption set.
+        The dialog is created on first use and reused, so the shell folder model is only
+        built once per session.
+        """
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self)
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+        self._dir_dialog.setWindowTitle(caption)
+        return self._dir_dialog
+
     def _browse_and_set(self, line_edit: QLineEdit):
-        dlg = QFileDialog(self)
-        dlg.setFileMode(QFileDialog.Directory)
+        dlg = self._dir_dialog_for()
         if dlg.exec_():
             path = dlg.selectedFiles()[0]
             line_edit.setText(path)
@@ -523,8 +925,41 @@ class MainWindow(QWidget):
         dlg = HashInfoDialog(self)
         dlg.exec_()
 
+    def _invalidate_criteria_cache(self, *_):
+        self._criteria_cache = None
+
+    def _get_selected_fields(self) -> tuple:
+        """Checked compare-field keys, recomputed only after a field action toggles."""
+        if self._fields_cache is None:
+            self._fields_cache = tuple(k for k, act in self.field_actions.items() if act.isChecked())
+        return self._fields_cache
+
+    def _get_criteria(self) -> dict:
+        """Search criteria for the current form state, rebuilt only after an input changed."""
+        if self._criteria_cache is None:
+            use_hash = self.hash_cb.isChecked()
+            self._criteria_cache = {
+                "fields": list(self._get_selected_fields()),
+                "size": False,
+                "name": False,
+                "metadata": True,
+                "hash": use_hash,
+                "hash_size": None,
+                "similarity": int(self.sim_slider.value()) if use_hash else None,
+                # derived from similarity and hash_size by the comparator when None
+                "max_hamming": None,
+            }
+        return self._criteria_cache
+
     def _on_field_toggled(self, checked: bool):
-        any_checked = any(act.isChecked() for act in self.field_actions.values())
+        self._fields_cache = None
+        self._criteria_cache = None
+        was_checked = self._checked_field_count > 0
+        self._checked_field_count += 1 if checked else -1
+        any_checked = self._checked_field_count > 0
+        if any_checked == was_checked:
+            # hash controls only change when the first field is checked or the last one unchecked
+            return
         self.hash_cb.setEnabled(not any_checked)
         self.sim_slider.setEnabled(not any_checked)
         if any_checked and self.hash_cb.isChecked():
@@ -546,16 +981,8 @@ class MainWindow(QWidget):
         self._settings.setValue("last_ref", ref)
         self._settings.setValue("last_work", work)
         self._settings.setValue("similarity", self.sim_slider.value())
-        fields = [k for k, v in self.field_actions.items() if v.isChecked()]
-        criteria = {
-            "fields": fields,
-            "size": False,
-            "name": False,
-            "metadata": True,
-            "hash": self.hash_cb.isChecked(),
-            "hash_size": None,
-            "similarity": int(self.sim_slider.value()) if self.hash_cb.isChecked() else None,
-        }
+        # each search thread gets its own copy of the memoized criteria
+        criteria = dict(self._get_criteria())
         logger.debug("MainWindow: starting search with criteria: %s", criteria)
         self.search_btn.setEnabled(False)
         try:
@@ -565,7 +992,8 @@ class MainWindow(QWidget):
         self._clear_tabs()
         self._thread = SearchThread(ref, work, criteria)
         self._thread.progress.connect(self._on_progress)
-        self._thread.results_ready.connect(self._on_results_ready)
+        self._thread.duplicates_ready.connect(self._on_duplicates_ready)
+        self._thread.uniques_ready.connect(self._on_uniques_ready)
         self._thread.finished.connect(self._on_search_finished)
         self._thread.start()
 
@@ -575,19 +1003,17 @@ class MainWindow(QWidget):
         except Exception:
             pass
 
-    def _on_results_ready(self, payload: dict):
-        self._last_results = payload
+    def _on_duplicates_ready(self, payload: dict):
+        # First half of a search result: start a fresh result set
+        self._last_results = dict(payload)
         self._selected_paths.clear()
 
-        # Extract the results
         duplicates = payload.get("duplicates", [])
-        uref = payload.get("unique_in_ref", [])
-        uwork = payload.get("unique_in_work", [])
 
-        # Update tab counts
+        # Update tab counts (uniques are filled in by _on_uniques_ready)
         self.tabs.setTabText(0, f"Duplicates ({len(duplicates)})")
-        self.tabs.setTabText(1, f"Uniques (Ref) ({len(uref)})")
-        self.tabs.setTabText(2, f"Uniques (Work) ({len(uwork)})")
+        self.tabs.setTabText(1, "Uniques (Ref) (0)")
+        self.tabs.setTabText(2, "Uniques (Work) (0)")
 
         # Clear tabs
         self._clear_tabs()
@@ -599,13 +1025,13 @@ class MainWindow(QWidget):
 
         # Connect "Select All" functionality
         self.select_all_duplicates_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.duplicates_layout)
+            lambda state: self._toggle_all_in_tab(state, "duplicates")
         )
         self.select_all_uniques_ref_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.uniques_ref_layout)
+            lambda state: self._toggle_all_in_tab(state, "unique_in_ref")
         )
         self.select_all_uniques_work_checkbox.stateChanged.connect(
-            lambda state: self._toggle_all_in_layout(state, self.uniques_work_layout)
+            lambda state: self._toggle_all_in_tab(state, "unique_in_work")
         )
 
         # Add "Select All" checkboxes back to the respective layouts
@@ -618,24 +1044,33 @@ class MainWindow(QWidget):
         self.select_all_uniques_ref_checkbox.setChecked(False)
         self.select_all_uniques_work_checkbox.setChecked(False)
 
-        # Populate Duplicates Tab
+        # Populate Duplicates Tab (first page only)
         if duplicates:
-            for r, w, reasons in duplicates:
-                self._add_duplicate(r, w, reasons)
+            self._render_next_page("duplicates")
         else:
             self._add_label(self.duplicates_layout, "No duplicates found.")
 
-        # Populate Uniques (Reference) Tab
+    def _on_uniques_ready(self, payload: dict):
+        # Second half of a search result: merge into the set started by _on_duplicates_ready
+        if self._last_results is None:
+            self._last_results = {}
+        self._last_results.update(payload)
+
+        uref = payload.get("unique_in_ref", [])
+        uwork = payload.get("unique_in_work", [])
+
+        self.tabs.setTabText(1, f"Uniques (Ref) ({len(uref)})")
+        self.tabs.setTabText(2, f"Uniques (Work) ({len(uwork)})")
+
+        # Populate Uniques (Reference) Tab (first page only)
         if uref:
-            for f in uref:
-                self._add_unique(f, side="ref")
+            self._render_next_page("unique_in_ref")
         else:
             self._add_label(self.uniques_ref_layout, "<i>No unique files in Reference</i>")
 
-        # Populate Uniques (Work) Tab
+        # Populate Uniques (Work) Tab (first page only)
         if uwork:
-            for f in uwork:
-                self._add_unique(f, side="work")
+            self._render_next_page("unique_in_work")
         else:
             self._add_label(self.uniques_work_layout, "<i>No unique files in Working</i>")
 
@@ -646,6 +1081,72 @@ class MainWindow(QWidget):
         except Exception:
             pass
 
+    def _render_next_page(self, key: str):
+        """Append the next RESULTS_PAGE_SIZE rows of _last_results[key] to its tab."""
+        items = (self._last_results or {}).get(key, [])
+        layout = getattr(self, f"{_RESULT_TABS[key]}_layout")
+        old_btn = self._more_buttons.pop(key, None)
+        if old_btn is not None:
+            layout.removeWidget(old_btn)
+            old_btn.deleteLater()
+        start = self._rendered_counts.get(key, 0)
+        self._render_targets[key] = min(start + RESULTS_PAGE_SIZE, len(items))
+        self._drain_page(key, self._render_generation)
+
+    def _drain_page(self, key: str, generation: int):
+        """
+        Build up to RENDER_CHUNK_SIZE pending rows of a page, then yield to the event loop
+        and continue on the next tick so the window stays responsive while a page fills.
+        """
+        if generation != self._render_generation:
+            # the tabs were cleared since this chunk was scheduled
+            return
+        items = (self._last_results or {}).get(key, [])
+        prefix = _RESULT_TABS[key]
+        container = getattr(self, f"{prefix}_container")
+        layout = getattr(self, f"{prefix}_layout")
+        start = self._rendered_counts.get(key, 0)
+        target = self._render_targets.get(key, start)
+        end = min(start + RENDER_CHUNK_SIZE, target)
+
+        # suspend repaints so Qt relayouts once per chunk rather than once per row
+        container.setUpdatesEnabled(False)
+        try:
+            for idx in range(start, end):
+                if key == "duplicates":
+                    r, w, reasons = items[idx]
+                    self._add_duplicate(r, w, reasons)
+                else:
+                    self._add_unique(items[idx], side="ref" if key == "unique_in_ref" else "work")
+            self._rendered_counts[key] = end
+            # decode the thumbnails that are on screen once the new rows have been laid out
+            QTimer.singleShot(0, lambda: self._load_visible_thumbs(key))
+            if end < target:
+                QTimer.singleShot(0, lambda: self._drain_page(key, generation))
+                return
+            self._refresh_more_button(key)
+        finally:
+            container.setUpdatesEnabled(True)
+
+    def _refresh_more_button(self, key: str):
+        """Put a "Show next" button for the rows of key not rendered yet at the end of its tab."""
+        layout = getattr(self, f"{_RESULT_TABS[key]}_layout")
+        old_btn = self._more_buttons.pop(key, None)
+        if old_btn is not None:
+            layout.removeWidget(old_btn)
+            old_btn.deleteLater()
+        remaining = len((self._last_results or {}).get(key, [])) - self._rendered_counts.get(key, 0)
+        if remaining > 0:
+            more_btn = make_button(f"Show next {min(remaining, RESULTS_PAGE_SIZE)} of {remaining}…", style_class="neutral")
+            more_btn.setProperty("result_key", key)
+            more_btn.clicked.connect(self._on_show_more_clicked)
+            layout.addWidget(more_btn)
+            self._more_buttons[key] = more_btn
+
+    def _on_show_more_clicked(self):
+        key = self.sender().property("result_key")
+        if key in _RESULT_TABS:
+            self._render_next_page(key)
 
     def _on_search_finished(self):
         self.search_btn.setEnabled(True)
@@ -656,130 +1157,353 @@ class MainWindow(QWidget):
             pass
 
     def _on_tab_changed(self, index: int):
-        # placeholder for future lazy-load / refresh behavior
-        return
+        for key in _RESULT_TABS:
+            self._load_visible_thumbs(key)
 
     # ---------- UI helpers for rendering ----------
+    def _make_results_container(self):
+        """Create a fresh (container, layout) pair for one of the result tabs."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setAlignment(Qt.AlignTop)
+        return container, layout
+
     def _clear_tabs(self):
-        for layout in (self.duplicates_layout, self.uniques_ref_layout, self.uniques_work_layout):
-            while layout.count():
-                item = layout.takeAt(0)
-                w = item.widget()
-                if w:
-                    w.deleteLater()
+        # Drop queued thumbnail decodes for rows that are about to disappear
+        self._thumb_pool.clear()
+        self._pending_thumbs.clear()
+        self._lazy_thumbs.clear()
+        # Keep some of the current rows for the next results; the rest go with their container
+        rows = {}
+        for indexed in self._row_index.values():
+            rows.update(indexed)
+        self._release_rows(list(rows))
+        # Swap in empty containers rather than removing rows one by one; Qt tears
+        # down the old widget trees in C++ on the next event loop tick.
+        self._more_buttons.clear()
+        self._rendered_counts = dict.fromkeys(_RESULT_TABS, 0)
+        self._render_targets = dict.fromkeys(_RESULT_TABS, 0)
+        self._render_generation += 1
+        for group in self._check_groups.values():
+            group.deleteLater()
+        self._check_groups.clear()
+        self._check_paths.clear()
+        self._check_anchor.clear()
+        self._row_index.clear()
+        for name in _RESULT_TABS.values():
+            scroll = getattr(self, f"{name}_scroll")
+            old = scroll.takeWidget()
+            container, layout = self._make_results_container()
+            setattr(self, f"{name}_container", container)
+            setattr(self, f"{name}_layout", layout)
+            scroll.setWidget(container)
+            if old is not None:
+                old.deleteLater()
 
     def _add_label(self, layout, text):
         lbl = QLabel(text)
         lbl.setWordWrap(True)
         layout.addWidget(lbl)
 
-    def _add_duplicate(self, r: ImageFileObj, w: ImageFileObj, reasons: List[str]):
-        row = QFrame()
-        row.setFrameShape(QFrame.StyledPanel)
-        row.setStyleSheet("background: rgba(255,255,255,0.02); border-radius:8px;")
-        rl = QHBoxLayout(row)
-        cb_r = QCheckBox()
-        cb_r.setProperty("path", r.path) 
-        cb_r.stateChanged.connect(lambda s, p=r.path: self._toggle_selection(p, s))
-        cb_w = QCheckBox()
-        cb_w.setProperty("path", w.path) 
-        cb_w.stateChanged.connect(lambda s, p=w.path: self._toggle_selection(p, s))
-        thumb_r = QLabel()
-        pixr = QPixmap(r.path)
-        if not pixr.isNull():
-            thumb_r.setPixmap(pixr.scaled(92, 92, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        thumb_w = QLabel()
-        pixw = QPixmap(w.path)
-        if not pixw.isNull():
-            thumb_w.setPixmap(pixw.scaled(92, 92, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        info = QLabel(f"Ref: {r.path}\nWork: {w.path}\nMatch: {', '.join(reasons)}")
-        info.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        compare_btn = make_button("Compare", style_class="neutral")
-        compare_btn.clicked.connect(lambda _, a=r, b=w, rs=reasons: self._open_compare_modal(a, b, rs))
-        rl.addWidget(cb_r)
-        rl.addWidget(thumb_r)
-        rl.addWidget(cb_w)
-        rl.addWidget(thumb_w)
-        rl.addWidget(info, 1)
-        rl.addWidget(compare_btn)
-        self.duplicates_layout.addWidget(row)
+    def _queue_thumb(self, tab_key: str, label: QLabel, path: str, side: int):
+        """Show a thumbnail for path on label, decoding it only once the row scrolls into view."""
+        pix = self._thumb_cache.get((path, side))
+        if pix is not None:
+            self._thumb_cache.move_to_end((path, side))
+            label.setPixmap(pix)
+            return
+        label.setPixmap(self._placeholder_pix)
+        self._lazy_thumbs.setdefault(tab_key, []).append((label, path, side))
+
+    def _load_visible_thumbs(self, tab_key: str):
+        """Request decodes for queued thumbnails of tab_key within one screen of its viewport."""
+        pending = self._lazy_thumbs.get(tab_key)
+        if not pending:
+            return
+        prefix = _RESULT_TABS[tab_key]
+        scroll = getattr(self, f"{prefix}_scroll")
+        if self.tabs.currentWidget() is not scroll:
+            return
+        container = getattr(self, f"{prefix}_container")
+        view_h = scroll.viewport().height()
+        top = scroll.verticalScrollBar().value() - view_h
+        bottom = scroll.verticalScrollBar().value() + 2 * view_h
+        still_pending = []
+        for label, path, side in pending:
+            if not shiboken6.isValid(label):
+                continue
+            y = label.mapTo(container, QPoint(0, 0)).y()
+            if y + label.height() >= top and y <= bottom:
+                self._request_thumb(label, path, side)
+            else:
+                still_pending.append((label, path, side))
+        self._lazy_thumbs[tab_key] = still_pending
+
+    def _request_thumb(self, label: QLabel, path: str, side: int):
+        """Queue a background decode of path for label (which already shows the placeholder)."""
+        key = (path, side)
+        waiting = self._pending_thumbs.get(key)
+        if waiting is not None:
+            waiting.append(label)
+            return
+        self._pending_thumbs[key] = [label]
+        self._thumb_pool.start(ThumbTask(path, side, self._thumb_signals))
 
-    def _add_unique(self, f: ImageFileObj, side: str = "ref"):
+    def _on_thumb_ready(self, path: str, side: int, img: QImage):
+        labels = self._pending_thumbs.pop((path, side), None)
+        if not labels or img.isNull():
+            return
+        pix = QPixmap.fromImage(img)
+        self._cache_thumb((path, side), pix)
+        for label in labels:
+            # the row may have been removed while the image was decoding
+            if shiboken6.isValid(label):
+                label.setPixmap(pix)
+
+    def _cache_thumb(self, key, pix: QPixmap):
+        """Store a scaled thumbnail, evicting least recently used ones beyond THUMB_CACHE_BYTES."""
+        cost = pix.width() * pix.height() * 4
+        old = self._thumb_cache.pop(key, None)
+        if old is not None:
+            self._thumb_cache_bytes -= old.width() * old.height() * 4
+        self._thumb_cache[key] = pix
+        self._thumb_cache_bytes += cost
+        while self._thumb_cache_bytes > THUMB_CACHE_BYTES and len(self._thumb_cache) > 1:
+            _, evicted = self._thumb_cache.popitem(last=False)
+            self._thumb_cache_bytes -= evicted.width() * evicted.height() * 4
+
+    def _make_row(self, kind: str) -> QFrame:
+        """
+        Build an empty result row of kind "duplicate" (two checkbox/thumbnail pairs and a
+        Compare button) or "unique" (one pair and an Open button). Rows are filled by
+        _add_duplicate/_add_unique and recycled through self._row_pool.
+        """
         row = QFrame()
         row.setFrameShape(QFrame.StyledPanel)
-        row.setStyleSheet("background: rgba(255,255,255,0.02); border-radius:8px;")
+        # styled by the window stylesheet (#result_row) instead of a per-row sheet
+        row.setObjectName("result_row")
         rl = QHBoxLayout(row)
-        cb = QCheckBox()
-        cb.setProperty("path", f.path)
-        cb.stateChanged.connect(lambda s, p=f.path: self._toggle_selection(p, s))
-        thumb = QLabel()
-        pix = QPixmap(f.path)
-        if not pix.isNull():
-            thumb.setPixmap(pix.scaled(112, 112, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        info = QLabel(f"{'Reference' if side == 'ref' else 'Working'} unique\nName: {f.name}\nSize: {f.size}\nDims: {f.dimensions}\nPath: {f.path}")
-        info.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        open_btn = make_button("Open", style_class="neutral")
-        open_btn.clicked.connect(lambda _, p=f.path: os.startfile(p) if os.path.exists(p) else None)
-        rl.addWidget(cb)
-        rl.addWidget(thumb)
-        rl.addWidget(info, 1)
-        rl.addWidget(open_btn)
+        pairs = 2 if kind == "duplicate" else 1
+        row.kind = kind
+        row.checks = [QCheckBox() for _ in range(pairs)]
+        row.thumbs = [QLabel() for _ in range(pairs)]
+        row.info = QLabel()
+        row.info.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        if kind == "duplicate":
+            row.action_btn = make_button("Compare", style_class="neutral")
+            row.action_btn.clicked.connect(self._on_compare_clicked)
+        else:
+            row.action_btn = make_button("Open", style_class="neutral")
+            row.action_btn.clicked.connect(self._on_open_clicked)
+        for cb, thumb in zip(row.checks, row.thumbs):
+            rl.addWidget(cb)
+            rl.addWidget(thumb)
+        rl.addWidget(row.info, 1)
+        rl.addWidget(row.action_btn)
+        return row
+
+    def _take_row(self, kind: str) -> QFrame:
+        pool = self._row_pool[kind]
+        return pool.pop() if pool else self._make_row(kind)
+
+    def _release_rows(self, rows):
+        """Detach rows from their tab and keep up to ROW_POOL_MAX of each kind for reuse."""
+        labels = set()
+        for row in rows:
+            if not shiboken6.isValid(row):
+                continue
+            labels.update(row.thumbs)
+            # do not keep the previous results alive through pooled rows
+            row.action_btn.match = None
+            for cb in row.checks:
+                group = cb.group()
+                if group is not None:
+                    group.removeButton(cb)
+            row.hide()
+            pool = self._row_pool[row.kind]
+            if len(pool) < ROW_POOL_MAX:
+                # reparenting also takes the row out of its layout
+                row.setParent(None)
+                pool.append(row)
+            else:
+                parent = row.parentWidget()
+                if parent is not None and parent.layout() is not None:
+                    parent.layout().removeWidget(row)
+                row.deleteLater()
+        # recycled labels must not receive thumbnails queued for their previous rows
+        if labels:
+            for key, pending in self._lazy_thumbs.items():
+                self._lazy_thumbs[key] = [t for t in pending if t[0] not in labels]
+            for key, waiting in self._pending_thumbs.items():
+                waiting[:] = [lbl for lbl in waiting if lbl not in labels]
+
+    def _add_duplicate(self, r: "ImageFileObj", w: "ImageFileObj", reasons: List[str]):
+        row = self._take_row("duplicate")
+        cb_r, cb_w = row.checks
+        self._add_row_checkbox("duplicates", r.path, cb_r)
+        self._add_row_checkbox("duplicates", w.path, cb_w)
+        thumb_r, thumb_w = row.thumbs
+        self._queue_thumb("duplicates", thumb_r, r.path, 92)
+        self._queue_thumb("duplicates", thumb_w, w.path, 92)
+        row.info.setText(f"Ref: {r.path}\nWork: {w.path}\nMatch: {', '.join(reasons)}")
+        # the match itself rather than its index: removals shrink _last_results["duplicates"]
+        row.action_btn.match = (r, w, reasons)
+        self.duplicates_layout.addWidget(row)
+        row.show()
+        row.setProperty("paths", [r.path, w.path])
+        row.setProperty("check_ids", [cb_r.property("check_id"), cb_w.property("check_id")])
+        self._row_index[r.path][row] = None
+        self._row_index[w.path][row] = None
+
+    def _add_unique(self, f: "ImageFileObj", side: str = "ref"):
+        row = self._take_row("unique")
+        key = "unique_in_ref" if side == "ref" else "unique_in_work"
+        cb = row.checks[0]
+        self._add_row_checkbox(key, f.path, cb)
+        self._queue_thumb(key, row.thumbs[0], f.path, 112)
+        row.info.setText(f"{'Reference' if side == 'ref' else 'Working'} unique\nName: {f.name}\nSize: {f.size}\nDims: {f.dimensions}\nPath: {f.path}")
+        row.action_btn.setProperty("path", f.path)
         if side == "ref":
             self.uniques_ref_layout.addWidget(row)
         else:
             self.uniques_work_layout.addWidget(row)
+        row.show()
+        row.setProperty("paths", [f.path])
+        row.setProperty("check_ids", [cb.property("check_id")])
+        self._row_index[f.path][row] = None
+
+    # Row buttons share these slots and carry their data as Qt properties,
+    # so no per-row closures are allocated.
+    def _on_compare_clicked(self):
+        match = getattr(self.sender(), "match", None)
+        if match is None:
+            return
+        a, b, reasons = match
+        self._open_compare_modal(a, b, reasons)
 
-    def _toggle_selection(self, path: str, state):
-        if state == Qt.Checked:
-            self._selected_paths.add(path)
+    def _on_open_clicked(self):
+        path = self.sender().property("path")
+        if not path:
+            return
+        try:
+            os.startfile(path)
+        except OSError:
+            # includes FileNotFoundError when the file was removed since the search
+            logger.debug("Cannot open %s", path, exc_info=True)
+
+    def _toggle_selection(self, path: str, checked: bool):
+        if checked:
+            self._selected_paths[path] = None
         else:
-            self._selected_paths.discard(path)
+            self._selected_paths.pop(path, None)
         self._update_selected_count()
 
     def _update_selected_count(self):
+        # Coalesce bursts of toggles (e.g. select all) into one label update per event loop tick
+        if self._count_update_pending:
+            return
+        self._count_update_pending = True
+        QTimer.singleShot(0, self._flush_selected_count)
+
+    def _flush_selected_count(self):
+        self._count_update_pending = False
         self.footer_label.setText(f"© Mufaddal Kothari    Selected: {len(self._selected_paths)}")
 
-    def _open_compare_modal(self, a: ImageFileObj, b: ImageFileObj, reasons):
-        meta1 = {"name": a.name, "size": a.size, "path": a.path, "dimensions": a.dimensions}
-        meta2 = {"name": b.name, "size": b.size, "path": b.path, "dimensions": b.dimensions}
-        modal = ComparisonModal(a.path, b.path, meta1, meta2, ", ".join(reasons), action_callback=self._on_modal_action, parent=self)
+    def _open_compare_modal(self, a: "ImageFileObj", b: "ImageFileObj", reasons):
+        modal = ComparisonModal(a.path, b.path, a.meta, b.meta, ", ".join(reasons), action_callback=self._on_modal_action, parent=self)
         modal.exec_()
 
     def _on_modal_action(self, action: str, paths: List[str]):
         if action.startswith("delete") and paths:
-            for p in paths:
-                try:
-                    if os.path.exists(p):
-                        send2trash(p)
-                except Exception:
-                    pass
-            self._remove_widgets_for_paths(paths)
+            self._start_file_op("modal_delete", _trash_paths, list(paths))
 
     # ---------- file operations / actions ----------
+    def _start_file_op(self, op: str, func, *args):
+        self._file_pool.start(FileOpTask(op, func, args, self._file_op_signals))
+
+    def _on_file_op_finished(self, op: str, done: list, errors: list):
+        if op not in _COPY_FILE_OPS:
+            try:
+                self._remove_widgets_for_paths(done)
+            except Exception:
+                logger.exception("Failed to remove widgets for %s", op)
+            for p in done:
+                self._selected_paths.pop(p, None)
+            self._update_selected_count()
+        messages = _FILE_OP_MESSAGES.get(op)
+        if messages is None:
+            return
+        error_title, error_text, done_text = messages
+        if errors:
+            QMessageBox.warning(self, error_title, f"{error_text}\n{errors}")
+        else:
+            QMessageBox.information(self, "Done", done_text)
+
+    @staticmethod
+    def _result_paths(key: str, items) -> List[str]:
+        """Paths shown by the rows of items (both sides of each duplicate match)."""
+        if key == "duplicates":
+            return [p for r, w, _ in items for p in (r.path, w.path)]
+        return [f.path for f in items]
+
+    def _drop_results_for_paths(self, paths: List[str]):
+        """
+        Remove every result involving one of paths from _last_results, rendered or not,
+        and move each tab's pager cursor back by the rendered entries that went away.
+        """
+        removed = set(paths)
+        results = self._last_results
+        if not removed or not results:
+            return
+        for key, (tab_index, title) in _RESULT_TAB_TITLES.items():
+            items = results.get(key)
+            if not items:
+                continue
+            if key == "duplicates":
+                keep = [r.path not in removed and w.path not in removed for r, w, _ in items]
+            else:
+                keep = [f.path not in removed for f in items]
+            if all(keep):
+                continue
+            rendered = self._rendered_counts.get(key, 0)
+            target = self._render_targets.get(key, rendered)
+            self._rendered_counts[key] = sum(keep[:rendered])
+            self._render_targets[key] = sum(keep[:target])
+            results[key] = [item for item, k in zip(items, keep) if k]
+            self.tabs.setTabText(tab_index, f"{title} ({len(results[key])})")
+            if target <= rendered:
+                # no page is filling (that would add the button when done): update it now
+                self._refresh_more_button(key)
+
     def _remove_widgets_for_paths(self, paths: List[str]):
-        path_set = set(paths)
-        for layout in (self.duplicates_layout, self.uniques_ref_layout, self.uniques_work_layout):
-            i = 0
-            while i < layout.count():
-                item = layout.itemAt(i)
-                widget = item.widget()
-                should_remove = False
-                if widget:
-                    labels = widget.findChildren(QLabel)
-                    for lbl in labels:
-                        txt = lbl.text() or ""
-                        for p in path_set:
-                            if p in txt:
-                                should_remove = True
-                                break
-                        if should_remove:
-                            break
-                if should_remove:
-                    w = layout.takeAt(i).widget()
-                    if w:
-                        w.deleteLater()
-                else:
-                    i += 1
+        self._drop_results_for_paths(paths)
+        rows = {}
+        for p in set(paths):
+            rows.update(self._row_index.pop(p, {}))
+        if not rows:
+            return
+        # Take all rows out with painting suspended so each tab relayouts and repaints once
+        containers = [getattr(self, f"{name}_container") for name in _RESULT_TABS.values()]
+        for container in containers:
+            container.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                if not shiboken6.isValid(row):
+                    continue
+                # forget the row's checkbox ids so _check_paths does not grow with removed rows
+                for check_id in row.property("check_ids") or ():
+                    self._check_paths.pop(check_id, None)
+                # a duplicate row is also indexed under its other image's path
+                for other in row.property("paths") or ():
+                    siblings = self._row_index.get(other)
+                    if siblings is not None:
+                        siblings.pop(row, None)
+                        if not siblings:
+                            del self._row_index[other]
+            self._release_rows(list(rows))
+        finally:
+            for container in containers:
+                container.setUpdatesEnabled(True)
 
     def _on_delete_all_duplicates(self):
         """Delete all duplicate working files (move to Trash)."""
@@ -794,21 +1518,7 @@ class MainWindow(QWidget):
         if reply != QMessageBox.Yes:
             return
         to_delete = [w.path for (r, w, _) in duplicates if getattr(w, "path", None)]
-        errors = []
-        for p in to_delete:
-            try:
-                if os.path.exists(p):
-                    send2trash(p)
-            except Exception as e:
-                errors.append((p, str(e)))
-        try:
-            self._remove_widgets_for_paths(to_delete)
-        except Exception:
-            logger.exception("Failed to remove widgets for deleted paths")
-        if errors:
-            QMessageBox.warning(self, "Delete errors", f"Some files could not be moved to Trash:\n{errors}")
-        else:
-            QMessageBox.information(self, "Done", "All duplicate working files moved to Trash.")
+        self._start_file_op("delete_duplicates", _trash_paths, to_delete)
 
     def _on_keep_all_duplicates(self):
         """Remove duplicates from view (keep files on disk)."""
@@ -835,58 +1545,42 @@ class MainWindow(QWidget):
         if not unique_in_ref and not unique_in_work:
             QMessageBox.information(self, "No uniques", "No unique files found.")
             return
-        dlg = QFileDialog(self, caption="Select destination folder")
-        dlg.setFileMode(QFileDialog.Directory)
+        dlg = self._dir_dialog_for("Select destination folder")
         if dlg.exec_():
             dest = dlg.selectedFiles()[0]
             dest_path = Path(dest)
-            errors = []
-            def _copy_list(list_files, sub):
+            plan = []
+
+            def _plan_list(list_files, sub):
                 if not list_files:
                     return
                 folder = dest_path / sub
                 folder.mkdir(parents=True, exist_ok=True)
+                # Resolve name collisions serially so parallel copies never race on a target
+                claimed = set()
                 for f in list_files:
-                    src = Path(f.path)
-                    if not src.exists():
-                        errors.append((str(src), "Missing"))
-                        continue
-                    dest_file = folder / src.name
-                    try:
-                        shutil.copy2(str(src), str(dest_file))
-                    except Exception as e:
-                        errors.append((str(src), str(e)))
-            _copy_list(unique_in_ref, "reference_uniques")
-            _copy_list(unique_in_work, "working_uniques")
-            if errors:
-                QMessageBox.warning(self, "Copy errors", f"Some files failed to copy:\n{errors}")
-            else:
-                QMessageBox.information(self, "Done", f"Copied uniques to {dest_path}")
+                    name = os.path.basename(f.path)
+                    plan.append((f.path, str(_unique_target(folder, name, claimed))))
+
+            try:
+                _plan_list(unique_in_ref, "reference_uniques")
+                _plan_list(unique_in_work, "working_uniques")
+            except OSError as e:
+                QMessageBox.warning(self, "Copy errors", f"Cannot create folders in {dest_path}:\n{e}")
+                return
+            # the copies run on the file-operation pool; _on_file_op_finished reports the result
+            self._start_file_op("save_uniques", _copy_paths, plan)
 
     def _on_move_selected(self):
         """Move selected files (from any tab) to a user-picked folder."""
         if not self._selected_paths:
             QMessageBox.information(self, "No selection", "No files selected to move.")
             return
-        dlg = QFileDialog(self, caption="Select destination folder")
-        dlg.setFileMode(QFileDialog.Directory)
+        dlg = self._dir_dialog_for("Select destination folder")
         if dlg.exec_():
             dest = dlg.selectedFiles()[0]
-            errors = []
-            for p in list(self._selected_paths):
-                try:
-                    if os.path.exists(p):
-                        dest_path = os.path.join(dest, os.path.basename(p))
-                        shutil.move(p, dest_path)
-                        self._remove_widgets_for_paths([p])
-                        self._selected_paths.discard(p)
-                except Exception as e:
-                    errors.append((p, str(e)))
-            self._update_selected_count()
-            if errors:
-                QMessageBox.warning(self, "Move errors", f"Some files could not be moved:\n{errors}")
-            else:
-                QMessageBox.information(self, "Done", "Selected files moved.")
+            plan = _plan_moves(list(self._selected_paths), dest)
+            self._start_file_op("move_selected", _move_paths, plan)
 
     def _on_delete_selected(self):
         """Move selected files to Trash (delete selected)."""
@@ -896,17 +1590,4 @@ class MainWindow(QWidget):
         reply = QMessageBox.question(self, "Confirm delete", f"Move {len(self._selected_paths)} selected files to Trash?", QMessageBox.Yes | QMessageBox.No)
         if reply != QMessageBox.Yes:
             return
-        errors = []
-        for p in list(self._selected_paths):
-            try:
-                if os.path.exists(p):
-                    send2trash(p)
-                    self._remove_widgets_for_paths([p])
-                    self._selected_paths.discard(p)
-            except Exception as e:
-                errors.append((p, str(e)))
-        self._update_selected_count()
-        if errors:
-            QMessageBox.warning(self, "Delete errors", f"Some files could not be moved to trash:\n{errors}")
-        else:
-            QMessageBox.information(self, "Done", "Selected files moved to Trash.") 
+        self._start_file_op("delete_selected", _trash_paths, list(self._selected_paths))
@@ -8,7 +8,10 @@
 #
 # Note: Keep Qt stylesheet-compatible properties only.
 
-FONT_FAMILY = '"Ubuntu Mono", "JetBrains Mono", "Fira Mono", "IBM Plex Mono", "Menlo", "Consolas", monospace'
+# UI font (with fallbacks). Applied with QApplication.setFont rather than in the QWidget
+# rule below: a font there is re-resolved for every widget on each stylesheet change.
+FONT_FAMILIES = ["Ubuntu Mono", "JetBrains Mono", "Fira Mono", "IBM Plex Mono", "Menlo", "Consolas"]
+FONT_SIZE_PX = 13
 
 GLASSY_STYLE = rf"""
 /* Base window and font */
@@ -17,8 +20,6 @@ QWidget {{
                                 stop:0 rgba(244,245,246,1.0),
                                 stop:1 rgba(239,240,241,1.0));
     color: #0f1720;
-    font-family: {FONT_FAMILY};
-    font-size: 13px;
 }}
 
 /* Group boxes and panes */
@@ -198,6 +199,12 @@ QPushButton#cache_open_btn {{
     border-radius: 8px;
 }}
 
+/* Result rows (duplicates / uniques tabs) */
+QFrame#result_row {{
+    background: rgba(255,255,255,0.02);
+    border-radius: 8px;
+}}
+
 /* Footer */
 #footer_label {{
     color: rgba(15,23,32,0.65);
@@ -209,8 +216,6 @@ DARK_STYLE = rf"""
 QWidget {{
     background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 rgba(12,14,18,1.0), stop:1 rgba(18,20,24,1.0));
     color: #e6eef5;
-    font-family: {FONT_FAMILY};
-    font-size: 13px;
 }}
 #left_panel {{ background: rgba(20,22,26,0.6); border:1px solid rgba(255,255,255,0.02); border-radius:10px; padding:8px; }}
 QTabWidget::pane {{ background: rgba(8,10,14,0.6); border-radius: 12px; padding: 10px; }}
@@ -224,5 +229,6 @@ QPushButton#cache_add_btn {{ background: qlineargradient(spread:pad, x1:0,y1:0,x
 QPushButton#cache_refresh_btn {{ background: #b45309; color:#fff; border-radius:8px; }}
 QPushButton#cache_rehash_btn {{ background: #2563eb; color:#fff; border-radius:8px; }}
 QPushButton#cache_open_btn {{ background: rgba(255,255,255,0.03); color:#e6eef5; border-radius:8px; }}
+QFrame#result_row {{ background: rgba(255,255,255,0.02); border-radius:8px; }}
 #footer_label {{ color: rgba(230,238,245,0.6); font-size:12px; }}
 """
\ No newline at end of file